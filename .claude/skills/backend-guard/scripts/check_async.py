@@ -5,21 +5,190 @@
 """
 
 import ast
+import hashlib
+import importlib.machinery
+import importlib.util
+import json
 import os
+import pickle
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, cast
+
+
+def _user_cache_dir() -> Path:
+    """
+    按用户的缓存目录（$XDG_CACHE_HOME 或 ~/.cache 下）
+
+    缓存不放在被扫描的仓库里：仓库内容不可信，不能让它决定被反序列化的数据
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'backend-guard'
+
+
+CACHE_DIR = _user_cache_dir()
+# AST 持久化缓存目录（按 SHA-256(源码) + Python 版本 作为键）
+AST_CACHE_DIR = CACHE_DIR / 'source-ast-cache'
+# 超过该天数未被命中的缓存条目视为过期
+AST_CACHE_MAX_AGE_DAYS = 7
+# 缓存命中/未命中计数
+ast_cache_stats = {'hits': 0, 'misses': 0}
+# 文件级检查结果索引：{绝对路径: [mtime_ns, size, issues]}，stat 未变的文件无需再打开
+CHECK_INDEX_PATH = CACHE_DIR / 'check_async.index.json'
+
+Issue = Dict[str, Any]
+Rule = Callable[[Any, 'AsyncBlockerChecker'], Optional[Issue]]
+
+
+def _make_issue(ctx: 'AsyncBlockerChecker', node: Union[ast.expr, ast.stmt], issue: str, suggestion: str) -> Issue:
+    """构造问题记录"""
+    return {
+        'line': node.lineno,
+        'function': ctx.current_function,
+        'issue': issue,
+        'suggestion': suggestion,
+        'code': ctx.source_segment(node)
+    }
+
+
+# 模块级阻塞调用表：顶层模块名 -> (阻塞的函数名集合，None 表示该模块的任意调用, 问题模板, 修复建议)
+BLOCKING_ATTR_MODULES: Dict[str, Tuple[Optional[frozenset], str, str]] = {
+    'time': (
+        frozenset({'sleep'}),
+        '在异步函数 {function} 中使用了 time.sleep',
+        '使用 asyncio.sleep 替代 time.sleep'
+    ),
+    'requests': (
+        None,
+        '在异步函数 {function} 中使用了同步 requests 库',
+        '使用 httpx.AsyncClient 替代 requests'
+    ),
+    'urllib': (
+        frozenset({'urlopen', 'urlretrieve'}),
+        '在异步函数 {function} 中使用了同步 urllib 网络请求',
+        '使用 httpx.AsyncClient 替代 urllib'
+    ),
+    'psycopg2': (
+        frozenset({'connect'}),
+        '在异步函数 {function} 中使用了同步 psycopg2 数据库连接',
+        '使用 asyncpg 或 SQLAlchemy AsyncSession 替代 psycopg2'
+    ),
+    'socket': (
+        frozenset({'create_connection', 'getaddrinfo', 'gethostbyname'}),
+        '在异步函数 {function} 中使用了同步 socket 网络调用',
+        '使用 asyncio.open_connection 或 loop.getaddrinfo 替代'
+    ),
+}
+
+# 未被导入覆盖的内置阻塞函数：函数名 -> (问题模板, 修复建议)
+BLOCKING_NAMES: Dict[str, Tuple[str, str]] = {
+    'open': (
+        '在异步函数 {function} 中使用了同步文件 I/O open()',
+        '使用 aiofiles 或 loop.run_in_executor 读写文件'
+    ),
+}
+
+
+def _qualified_call_name(func: ast.expr, ctx: 'AsyncBlockerChecker') -> Optional[str]:
+    """根据导入记录把调用目标还原为完整名称，例如 `t.sleep` -> `time.sleep`"""
+    if isinstance(func, ast.Name):
+        return ctx.imported_names.get(func.id)
+
+    parts = []
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if not isinstance(func, ast.Name) or func.id not in ctx.module_aliases:
+        return None
+    parts.append(ctx.module_aliases[func.id])
+    return '.'.join(reversed(parts))
+
+
+def rule_blocking_call(node: ast.Call, ctx: 'AsyncBlockerChecker') -> Optional[Issue]:
+    """查表检查异步函数中的阻塞调用（time.sleep、requests、urllib、psycopg2、socket、open）"""
+    if not ctx.is_async:
+        return None
+
+    qualified_name = _qualified_call_name(node.func, ctx)
+    if qualified_name is None:
+        if isinstance(node.func, ast.Name) and node.func.id in BLOCKING_NAMES:
+            template, suggestion = BLOCKING_NAMES[node.func.id]
+            return _make_issue(ctx, node, template.format(function=ctx.current_function), suggestion)
+        return None
+
+    entry = BLOCKING_ATTR_MODULES.get(qualified_name.partition('.')[0])
+    if entry is None:
+        return None
+
+    blocking_attrs, template, suggestion = entry
+    if blocking_attrs is not None and qualified_name.rpartition('.')[2] not in blocking_attrs:
+        return None
+
+    return _make_issue(ctx, node, template.format(function=ctx.current_function), suggestion)
+
+
+# 按节点类型注册的检查规则：一次遍历，对每个节点运行对应的全部规则
+# 新增检查只需编写规则函数并登记到这里，不会增加额外的遍历
+RULES_BY_TYPE: Dict[type, List[Rule]] = {
+    ast.Call: [rule_blocking_call],
+}
+
 
 class AsyncBlockerChecker(ast.NodeVisitor):
     """检查异步代码中的阻塞调用"""
 
-    def __init__(self, filename: str):
+    def __init__(
+        self,
+        filename: str,
+        source: Optional[str] = None,
+        rules_by_type: Optional[Dict[type, List[Rule]]] = None
+    ):
         self.filename = filename
-        self.issues = []
-        self.current_function = None
+        self.source = source
+        self.issues: List[Issue] = []
+        self.current_function: Optional[str] = None
         self.is_async = False
+        # `import time as t` / `import urllib.request` 引入的本地名 -> 模块名
+        self.module_aliases: Dict[str, str] = {}
+        # `from time import sleep as s` 引入的本地名 -> 完整名称（如 time.sleep）
+        self.imported_names: Dict[str, str] = {}
+        self.rules_by_type = RULES_BY_TYPE if rules_by_type is None else rules_by_type
+
+    def source_segment(self, node: Union[ast.expr, ast.stmt]) -> Optional[str]:
+        """仅在规则命中时按需截取节点对应的源码片段，避免重建整棵子树"""
+        if self.source is None:
+            return None
+        return ast.get_source_segment(self.source, node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """对当前节点运行已注册的规则，然后继续遍历子节点"""
+        for rule in self.rules_by_type.get(type(node), ()):
+            issue = rule(node, self)
+            if issue is not None:
+                self.issues.append(issue)
+        super().generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        """记录模块导入别名"""
+        for alias in node.names:
+            if alias.asname:
+                self.module_aliases[alias.asname] = alias.name
+            else:
+                # `import urllib.request` 绑定的本地名是顶层包 urllib
+                top_level = alias.name.partition('.')[0]
+                self.module_aliases[top_level] = top_level
+        self.generic_visit(node)
 
-    def visit_AsyncFunctionDef(self, node):
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        """记录 `from module import name` 形式的导入"""
+        if node.module and not node.level:
+            for alias in node.names:
+                self.imported_names[alias.asname or alias.name] = f'{node.module}.{alias.name}'
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         """访问异步函数定义"""
         self.is_async = True
         self.current_function = node.name
@@ -27,40 +196,7 @@ class AsyncBlockerChecker(ast.NodeVisitor):
         self.is_async = False
         self.current_function = None
 
-    def visit_Call(self, node):
-        """检查函数调用"""
-        if self.is_async:
-            # 检查常见的阻塞调用
-            if isinstance(node.func, ast.Name):
-                func_name = node.func.id
-
-                # time.sleep 阻塞调用
-                if func_name == 'sleep':
-                    # 检查是否来自 time 模块
-                    for parent in ast.walk(ast.parse(ast.unparse(node))):
-                        if isinstance(parent, ast.Attribute):
-                            if isinstance(parent.value, ast.Name) and parent.value.id == 'time':
-                                self.issues.append({
-                                    'line': node.lineno,
-                                    'function': self.current_function,
-                                    'issue': f'在异步函数 {self.current_function} 中使用了 time.sleep',
-                                    'suggestion': '使用 asyncio.sleep 替代 time.sleep'
-                                })
-                                break
-
-            # 检查 requests 库调用
-            elif isinstance(node.func, ast.Attribute):
-                if isinstance(node.func.value, ast.Name) and node.func.value.id == 'requests':
-                    self.issues.append({
-                        'line': node.lineno,
-                        'function': self.current_function,
-                        'issue': f'在异步函数 {self.current_function} 中使用了同步 requests 库',
-                        'suggestion': '使用 httpx.AsyncClient 替代 requests'
-                    })
-
-        self.generic_visit(node)
-
-    def visit_For(self, node):
+    def visit_For(self, node: ast.For) -> None:
         """检查循环中的潜在阻塞操作"""
         if self.is_async:
             # 检查是否有同步数据库操作
@@ -69,14 +205,93 @@ class AsyncBlockerChecker(ast.NodeVisitor):
         else:
             self.generic_visit(node)
 
-def check_file(filepath: Path) -> List[Dict[str, Any]]:
+def _ast_cache_path(content: str) -> Path:
+    """根据源码内容和 Python 版本计算缓存文件路径"""
+    python_version = '.'.join(map(str, sys.version_info[:3]))
+    key = hashlib.sha256(content.encode('utf-8')).hexdigest() + '-py' + python_version
+    return AST_CACHE_DIR / key[:2] / key[2:]
+
+
+def _is_private_cache_file(st: os.stat_result) -> bool:
+    """缓存文件必须属于当前用户且其他人不可写，否则不信任其内容"""
+    if not hasattr(os, 'getuid'):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _read_cached_ast(cache_path: Path) -> Optional[ast.Module]:
+    """
+    读取缓存的 AST；文件不属于当前用户、已过期或摘要不匹配时返回 None
+
+    缓存文件格式：SHA-256(payload) 32 字节 + pickle payload
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if not _is_private_cache_file(st):
+                return None
+            if time.time() - st.st_mtime >= AST_CACHE_MAX_AGE_DAYS * 86400:
+                return None
+            data = f.read()
+    except OSError:
+        return None
+
+    digest, payload = data[:32], data[32:]
+    if len(digest) != 32 or hashlib.sha256(payload).digest() != digest:
+        return None
+    try:
+        tree = pickle.loads(payload)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    return tree if isinstance(tree, ast.Module) else None
+
+
+def load_ast(content: str, filename: str = '<unknown>') -> ast.Module:
+    """解析源码，优先从用户缓存目录加载已解析的 AST，任何不匹配都回退到重新解析"""
+    cache_path = _ast_cache_path(content)
+
+    tree = _read_cached_ast(cache_path)
+    if tree is not None:
+        # 刷新时间戳，保持常用条目不过期
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        ast_cache_stats['hits'] += 1
+        return tree
+
+    ast_cache_stats['misses'] += 1
+    tree = cast(ast.Module, compile(content, filename, 'exec', ast.PyCF_ONLY_AST))
+
+    # 先写临时文件再重命名，保证缓存写入是原子的
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        payload = pickle.dumps(tree, protocol=5)
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(hashlib.sha256(payload).digest())
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return tree
+
+
+def check_file(filepath: Union[str, Path]) -> List[Dict[str, Any]]:
     """检查单个文件"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        tree = ast.parse(content)
-        checker = AsyncBlockerChecker(str(filepath))
+        tree = load_ast(content, str(filepath))
+
+        # 没有异步函数的模块不可能存在异步阻塞问题，直接跳过完整遍历
+        if not any(isinstance(node, ast.AsyncFunctionDef) for node in ast.walk(tree)):
+            return []
+
+        checker = AsyncBlockerChecker(str(filepath), source=content)
         checker.visit(tree)
         return checker.issues
 
@@ -88,6 +303,117 @@ def check_file(filepath: Path) -> List[Dict[str, Any]]:
             'suggestion': '检查文件语法是否正确'
         }]
 
+
+def _check_file_in_worker(filepath: Union[str, Path]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """在子进程中检查文件，并带回本次检查产生的缓存命中/未命中计数"""
+    before = dict(ast_cache_stats)
+    issues = check_file(filepath)
+    stats = {key: ast_cache_stats[key] - before[key] for key in ast_cache_stats}
+    return issues, stats
+
+
+def check_files(python_files: List[str]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """检查多个文件，多于一个文件时使用进程池并行解析"""
+    if len(python_files) <= 1:
+        return [(filepath, check_file(filepath)) for filepath in python_files]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for filepath, (issues, stats) in zip(
+            python_files, executor.map(_check_file_in_worker, python_files, chunksize=8)
+        ):
+            for key, value in stats.items():
+                ast_cache_stats[key] += value
+            results.append((filepath, issues))
+    return results
+
+
+def _checker_version() -> str:
+    """以本脚本内容的哈希作为检查器版本，规则变更后旧索引自动失效"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_check_index() -> Dict[str, List[Any]]:
+    """加载上次运行保存的文件检查结果索引"""
+    try:
+        with open(CHECK_INDEX_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('checker_version') != _checker_version():
+        return {}
+    return data.get('files', {})
+
+
+def save_check_index(files: Dict[str, List[Any]]) -> None:
+    """原子地写入文件检查结果索引"""
+    try:
+        CHECK_INDEX_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = CHECK_INDEX_PATH.with_name(f'{CHECK_INDEX_PATH.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'checker_version': _checker_version(), 'files': files}, f, ensure_ascii=False)
+        os.replace(tmp_path, CHECK_INDEX_PATH)
+    except OSError:
+        pass
+
+
+def check_files_incremental(python_files: List[str]) -> Tuple[List[Tuple[str, List[Dict[str, Any]]]], int]:
+    """
+    增量检查：mtime_ns 和 size 与索引一致的文件直接复用上次结果，不再读取
+
+    返回 (按输入顺序排列的检查结果, 跳过的文件数)；列出后又被删除的文件不出现在结果中
+    """
+    index = load_check_index()
+    stats_by_path = {}
+    cached = {}
+    changed = []
+
+    for filepath in python_files:
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            # 遍历目录与 stat 之间文件被删除或重命名
+            continue
+        stats_by_path[filepath] = (st.st_mtime_ns, st.st_size)
+        entry = index.get(os.path.abspath(filepath))
+        if entry is not None and (entry[0], entry[1]) == stats_by_path[filepath]:
+            cached[filepath] = entry[2]
+        else:
+            changed.append(filepath)
+
+    fresh = dict(check_files(changed))
+    for filepath, issues in fresh.items():
+        mtime_ns, size = stats_by_path[filepath]
+        index[os.path.abspath(filepath)] = [mtime_ns, size, issues]
+
+    # 清理已删除文件的索引项，避免索引随删除/重命名无限增长；本次刚 stat 过的文件无需再查
+    checked = {os.path.abspath(filepath) for filepath in stats_by_path}
+    for path in [path for path in index if path not in checked and not os.path.exists(path)]:
+        del index[path]
+    save_check_index(index)
+
+    results = [
+        (filepath, cached[filepath] if filepath in cached else fresh[filepath])
+        for filepath in python_files
+        if filepath in stats_by_path
+    ]
+    return results, len(cached)
+
+
+def iter_python_files(root: Union[str, Path]) -> Iterator[str]:
+    """基于 os.scandir 递归遍历目录，只产出 .py 文件路径字符串，不为每个条目构造 Path"""
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    yield entry.path
+
+
 def main():
     """主函数"""
     if len(sys.argv) > 1:
@@ -104,22 +430,28 @@ def main():
     all_issues = []
 
     if target_path.is_file():
-        python_files = [target_path]
+        python_files = [str(target_path)]
     else:
-        python_files = list(target_path.rglob('*.py'))
+        python_files = list(iter_python_files(target_path))
 
-    for filepath in python_files:
+    results, skipped = check_files_incremental(python_files)
+
+    # 所有文件检查完成后再统一输出，避免多进程输出交错
+    for filepath, issues in results:
         print(f"🔍 检查文件: {filepath}")
-        issues = check_file(filepath)
         if issues:
             all_issues.extend(issues)
             for issue in issues:
                 print(f"  ❌ 行 {issue['line']}: {issue['issue']}")
+                if issue.get('code'):
+                    print(f"     📄 代码: {issue['code']}")
                 print(f"     💡 建议: {issue['suggestion']}")
         else:
             print(f"  ✅ 未发现异步阻塞问题")
 
     print(f"\n📊 总计发现 {len(all_issues)} 个问题")
+    print(f"🗂️  AST 缓存: 命中 {ast_cache_stats['hits']} 次, 未命中 {ast_cache_stats['misses']} 次")
+    print(f"⏭️  未变更文件: 跳过 {skipped} 个")
 
     if all_issues:
         print("\n🔧 修复建议:")
@@ -130,5 +462,35 @@ def main():
         print("🎉 所有代码都符合异步编程规范!")
         return 0
 
+# mypyc 编译产物的模块名；与脚本本身区分开，避免回退时把本脚本作为模块再导入一次
+NATIVE_MODULE_NAME = 'check_async_impl'
+
+
+def _load_implementation() -> Callable[[], int]:
+    """
+    优先使用 mypyc 编译出的扩展模块（同目录下的 check_async_impl.*.so）
+
+    只按扩展模块后缀查找，不会导入任何 .py 文件；未编译，或扩展模块比源码旧时，
+    直接使用当前模块中已加载的纯 Python 实现
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    finder = importlib.machinery.FileFinder(
+        script_dir,
+        (importlib.machinery.ExtensionFileLoader, importlib.machinery.EXTENSION_SUFFIXES)
+    )
+    spec = finder.find_spec(NATIVE_MODULE_NAME)
+    if spec is None or spec.origin is None or spec.loader is None:
+        return main
+    if os.path.getmtime(spec.origin) < os.path.getmtime(__file__):
+        return main
+
+    try:
+        native = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(native)
+    except ImportError:
+        return main
+    return native.main
+
+
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(_load_implementation()())
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Add task query indexes
+
+Revision ID: 5c2e9a7d41b3
+Revises: 1408c59b0b41
+Create Date: 2026-10-15 23:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e9a7d41b3'
+down_revision: Union[str, Sequence[str], None] = '1408c59b0b41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_created_at', 'tasks', [sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_tasks_status', 'tasks', ['status'], unique=False)
+    op.create_index(
+        'ix_tasks_completed_updated_at', 'tasks', ['updated_at'], unique=False,
+        postgresql_where=sa.text("status = 'COMPLETED'"),
+        sqlite_where=sa.text("status = 'COMPLETED'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_completed_updated_at', table_name='tasks')
+    op.drop_index('ix_tasks_status', table_name='tasks')
+    op.drop_index('ix_tasks_created_at', table_name='tasks')
@@ -0,0 +1,28 @@
+"""Add status/created_at composite index
+
+Revision ID: 9b7e3f1c2a64
+Revises: 5c2e9a7d41b3
+Create Date: 2026-10-15 23:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b7e3f1c2a64'
+down_revision: Union[str, Sequence[str], None] = '5c2e9a7d41b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_status_created_at', 'tasks', ['status', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_status_created_at', table_name='tasks')
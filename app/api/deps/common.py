@@ -1,17 +1,6 @@
-from fastapi import Depends, HTTPException
-from datetime import datetime
-from app.core.config import settings
+import time
 
 
-def get_current_timestamp() -> datetime:
-    """Get current timestamp for responses"""
-    return datetime.utcnow()
-
-
-def get_app_info() -> dict:
-    """Get application information"""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "debug": settings.debug
-    }
\ No newline at end of file
+def get_current_timestamp() -> int:
+    """Get current timestamp for responses (nanoseconds since the epoch, UTC)"""
+    return time.time_ns()
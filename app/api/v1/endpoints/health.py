@@ -1,26 +1,25 @@
-from fastapi import APIRouter, Depends
-from datetime import datetime
+from fastapi import APIRouter
 from app.schemas import HealthResponse
 from app.core.config import settings
-from app.api.deps.common import get_current_timestamp, get_app_info
+from app.api.deps.common import get_current_timestamp
 
 router = APIRouter()
 
 
 @router.get("/health", response_model=HealthResponse, summary="Health Check")
-async def health_check(
-    timestamp: datetime = Depends(get_current_timestamp),
-    app_info: dict = Depends(get_app_info)
-):
+async def health_check():
     """
     Health check endpoint to verify API is running.
 
+    Values are read directly rather than through Depends so the
+    dependency resolver is skipped on this hot, trivial path.
+
     Returns:
         HealthResponse: API health status and metadata
     """
     return HealthResponse(
         status="healthy",
-        app_name=app_info["name"],
-        version=app_info["version"],
-        timestamp=timestamp
+        app_name=settings.app_name,
+        version=settings.app_version,
+        timestamp=get_current_timestamp()
     )
\ No newline at end of file
@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import functools
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.schemas import TaskCreate, TaskResponse
 from app.database import get_db
 from app.crud import task as task_crud
+from app.models import Task
 from app.worker.tasks.ai_tasks import run_ai_text_generation
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+TASK_RESPONSE_FIELDS = tuple(TaskResponse.model_fields)
+
 
 @router.post("/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED, summary="Create a new task")
 async def create_task(
@@ -25,56 +34,69 @@ async def create_task(
 
     The task will be processed asynchronously in the background.
     """
-    try:
-        # 1. Create task record in database
-        task = await task_crud.create_task(db=db, obj_in=task_in)
+    # 1. Create task record in database
+    task = await task_crud.create_task(db=db, obj_in=task_in)
+    # Commit before dispatching so the worker can see the new row
+    await db.commit()
 
-        # 2. Trigger Celery task for AI processing
-        try:
-            # Convert task.id to string for Celery compatibility
-            run_ai_text_generation.delay(
+    # 2. Trigger Celery task for AI processing
+    try:
+        # .delay() publishes to the broker synchronously, so run it in the
+        # default thread pool to keep the event loop free.
+        # Convert task.id to string for Celery compatibility
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            functools.partial(
+                run_ai_text_generation.delay,
                 task_id=str(task.id),
                 prompt=task.prompt,
                 model=task.model,
                 provider=task.provider
             )
-            print(f"🚀 Celery task triggered for task_id: {task.id}")
-            print(f"🔌 Provider: {task.provider or 'default'}")
-            print(f"🧠 Model: {task.model or 'default'}")
-        except Exception as celery_error:
-            print(f"⚠️ Failed to trigger Celery task: {celery_error}")
-            # Continue without Celery - task will remain in PENDING state
-
-        # Return properly validated Pydantic response model
-        return TaskResponse.model_validate(task)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create task: {str(e)}"
         )
+        logger.info(
+            "Celery task triggered for task_id=%s provider=%s model=%s",
+            task.id, task.provider or "default", task.model or "default"
+        )
+    except Exception as celery_error:
+        logger.warning("Failed to trigger Celery task for task_id=%s: %s", task.id, celery_error)
+        # Continue without Celery - task will remain in PENDING state
+
+    # Return properly validated Pydantic response model
+    return TaskResponse.model_validate(task)
+
+
+# Upper bound on a GET /tasks page, so a page is always fetched and serialized in one piece
+MAX_TASK_PAGE_SIZE = 1000
+
+
+def _task_payload(task: Task) -> dict:
+    """Build the JSON-ready response body for one task row"""
+    # Rows come straight from the database, so build response models without re-running validation
+    response = TaskResponse.model_construct(
+        **{field: getattr(task, field) for field in TASK_RESPONSE_FIELDS}
+    )
+    return response.model_dump(mode="json")
 
 
 @router.get("/tasks", response_model=List[TaskResponse], summary="Get all tasks")
 async def get_tasks(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_TASK_PAGE_SIZE),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve a list of tasks with pagination.
 
     - **skip**: Number of tasks to skip (default: 0)
-    - **limit**: Maximum number of tasks to return (default: 100)
+    - **limit**: Maximum number of tasks to return (default: 100, max: 1000)
+
+    The page is fetched before the response starts, so database errors
+    still surface as a 500 through the app's exception handlers.
     """
-    try:
-        tasks = await task_crud.get_tasks(db=db, skip=skip, limit=limit)
-        # Convert SQLAlchemy models to Pydantic response models
-        return [TaskResponse.model_validate(task) for task in tasks]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve tasks: {str(e)}"
-        )
+    tasks = await task_crud.get_tasks(db=db, skip=skip, limit=limit)
+    return ORJSONResponse([_task_payload(task) for task in tasks])
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse, summary="Get a specific task")
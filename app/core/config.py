@@ -1,4 +1,6 @@
-from pydantic import BaseSettings, Field
+from functools import lru_cache
+from pydantic import Field, PrivateAttr, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional, List
 import secrets
 
@@ -31,10 +33,19 @@ class Settings(BaseSettings):
     )
     cors_allow_credentials: bool = Field(default=True, description="Allow CORS credentials")
 
+    # 由 cors_origins_str 在构造时计算得出；私有属性不是配置字段，不会从环境变量读取
+    _cors_origins: List[str] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def _split_cors_origins(self) -> "Settings":
+        """构造时将逗号分隔的字符串转换为列表，避免每次访问重复解析"""
+        self._cors_origins = [origin.strip() for origin in self.cors_origins_str.split(",") if origin.strip()]
+        return self
+
     @property
     def cors_origins(self) -> List[str]:
-        """将逗号分隔的字符串转换为列表"""
-        return [origin.strip() for origin in self.cors_origins_str.split(",") if origin.strip()]
+        """CORS allowed origins (derived from cors_origins_str)"""
+        return self._cors_origins
 
     # ============================================
     # 🗄️ Database Configuration
@@ -44,6 +55,16 @@ class Settings(BaseSettings):
         description="Database connection URL"
     )
 
+    @model_validator(mode="after")
+    def _require_server_database_in_production(self) -> "Settings":
+        """生产环境必须使用独立数据库服务，SQLite 仅用于本地开发和测试"""
+        if self.environment == "production" and self.database_url.startswith("sqlite"):
+            raise ValueError("SQLite database_url is not supported in production")
+        return self
+
+    # 多个 uvicorn worker 时仅让一个进程（或一次性初始化任务）执行建表
+    run_init_db: bool = Field(default=True, description="Create missing tables at API startup")
+
     # Database Pool Configuration
     db_pool_size: int = Field(default=10, description="Database pool size")
     db_max_overflow: int = Field(default=20, description="Database max overflow")
@@ -73,6 +94,10 @@ class Settings(BaseSettings):
         description="Celery result backend URL"
     )
 
+    # Queue Configuration: long AI inference tasks get their own queue so they can't starve short tasks
+    celery_ai_queue: str = Field(default="ai_long", description="Queue for long-running AI tasks")
+    celery_short_queue: str = Field(default="short", description="Default queue for short tasks")
+
     # Worker Configuration
     worker_concurrency: int = Field(default=4, description="Celery worker concurrency")
     worker_prefetch_multiplier: int = Field(default=1, description="Worker prefetch multiplier")
@@ -155,11 +180,26 @@ class Settings(BaseSettings):
         description="Test database connection URL"
     )
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"  # 忽略额外的环境变量
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",  # 忽略额外的环境变量
+        frozen=True,  # 配置加载后只读，避免运行时被意外修改
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    获取全局唯一的配置实例
+
+    环境变量只解析一次。模块导入时即绑定到 settings，各模块直接引用它，
+    没有路由通过 Depends(get_settings) 注入，因此 dependency_overrides 对其无效；
+    测试需要其他配置时请直接构造 Settings(...)
+    """
+    return Settings()
+
 
 # 全局设置实例
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+日志配置
+通过 QueueHandler + QueueListener 将日志 I/O 移出事件循环
+"""
+import contextlib
+import logging
+import logging.handlers
+import queue
+from typing import Iterator
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+@contextlib.contextmanager
+def queue_logging(level: str = "INFO") -> Iterator[logging.handlers.QueueListener]:
+    """
+    在上下文期间为根日志器启用基于队列的日志处理
+
+    请求处理路径上的 logger 调用只把记录放入队列，
+    真正的格式化和写 stderr 由 QueueListener 的后台线程完成。
+    QueueHandler 只在监听器运行期间挂在根日志器上，
+    退出时先摘除处理器再停止监听器，因此不会有记录滞留在无人消费的队列里，
+    重复进入（如热重载）也不会叠加处理器。
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level.upper())
+
+    listener.start()
+    root_logger.addHandler(queue_handler)
+    try:
+        yield listener
+    finally:
+        root_logger.removeHandler(queue_handler)
+        # stop() 会先处理完队列中剩余的记录
+        listener.stop()
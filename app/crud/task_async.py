@@ -0,0 +1,376 @@
+"""
+Async task CRUD used by the API and the MCP server
+"""
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, update, func, case, bindparam, and_, null, Row
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence
+
+from app.models import Task, TaskDataVersion
+from app.schemas import TaskCreate, TaskUpdate, TaskStatus
+
+# Every task write bumps the data version in the same transaction (see get_task_data_version)
+_BUMP_DATA_VERSION = update(TaskDataVersion).values(version=TaskDataVersion.version + 1)
+
+
+async def create_task(db: AsyncSession, *, obj_in: TaskCreate) -> Task:
+    """Create a new task; the caller commits"""
+    # RETURNING fetches the generated id/created_at in the same round-trip
+    stmt = insert(Task).values(
+        prompt=obj_in.prompt,
+        model=obj_in.model,
+        provider=obj_in.provider,
+        priority=obj_in.priority,
+        status=TaskStatus.PENDING
+    ).returning(Task)
+    task = (await db.execute(stmt)).scalar_one()
+    await db.execute(_BUMP_DATA_VERSION)
+    return task
+
+# Point lookup built once; each call only binds the id
+_GET_TASK_BY_ID = select(Task).where(Task.id == bindparam("task_id"))
+
+
+async def get_task(db: AsyncSession, task_id: int) -> Optional[Task]:
+    """Get a task by ID"""
+    result = await db.execute(_GET_TASK_BY_ID, {"task_id": task_id})
+    return result.scalar_one_or_none()
+
+
+async def get_tasks(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Task]:
+    """Get multiple tasks with pagination"""
+    result = await db.execute(
+        select(Task).offset(skip).limit(limit).order_by(Task.created_at.desc())
+    )
+    return result.scalars().all()
+
+
+async def update_task(db: AsyncSession, *, db_obj: Task, obj_in: TaskUpdate) -> Task:
+    """Update an existing task; the caller commits"""
+    # Only the explicitly set fields, read straight off the model without a full model_dump
+    update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
+    if not update_data:
+        return db_obj
+
+    stmt = (
+        update(Task)
+        .where(Task.id == db_obj.id)
+        .values(**update_data)
+        .returning(Task)
+        .execution_options(populate_existing=True)
+    )
+    task = (await db.execute(stmt)).scalar_one()
+    await db.execute(_BUMP_DATA_VERSION)
+    return task
+
+
+async def delete_task(db: AsyncSession, *, task_id: int) -> bool:
+    """Delete a task by ID; the caller commits"""
+    result = await db.execute(delete(Task).filter(Task.id == task_id))
+    if result.rowcount == 0:
+        return False
+    await db.execute(_BUMP_DATA_VERSION)
+    return True
+
+
+# MCP-specific CRUD functions
+async def get_tasks_with_filters(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    before_id: Optional[int] = None
+) -> List[Task]:
+    """Get tasks with advanced filtering for MCP"""
+    query = _filtered_tasks_query(skip, limit, status, created_after, before_id)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def iter_tasks(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    batch_size: int = 200
+) -> AsyncIterator[Sequence[Task]]:
+    """Yield filtered tasks in batches through a server-side cursor"""
+    query = _filtered_tasks_query(skip, limit, status, created_after, before_id)
+    result = await db.stream_scalars(query.execution_options(yield_per=batch_size))
+    async for batch in result.partitions(batch_size):
+        yield batch
+
+
+def _filtered_tasks_query(
+    skip: int,
+    limit: int,
+    status: Optional[str],
+    created_after: Optional[datetime],
+    before_id: Optional[int] = None
+):
+    """Build the paginated, newest-first task query shared by the MCP listings
+
+    before_id is a keyset cursor: pass the last ID of the previous page to
+    continue after it without the database scanning and discarding skip rows.
+    IDs are assigned in insertion order, the same order created_at follows.
+    """
+    query = select(Task)
+
+    if status:
+        query = query.filter(Task.status == TaskStatus(status.upper()))
+
+    if created_after:
+        query = query.filter(Task.created_at >= created_after)
+
+    if before_id is not None:
+        query = query.filter(Task.id < before_id)
+
+    return query.offset(skip).limit(limit).order_by(Task.created_at.desc(), Task.id.desc())
+
+
+async def get_total_task_count(db: AsyncSession) -> int:
+    """Get total number of tasks"""
+    result = await db.execute(select(func.count()).select_from(Task))
+    return result.scalar_one()
+
+
+async def get_task_counts_by_status(db: AsyncSession) -> List[Dict[str, Any]]:
+    """Get task count grouped by status"""
+    result = await db.execute(
+        select(
+            Task.status,
+            func.count(Task.id).label('count')
+        ).group_by(Task.status)
+    )
+
+    return [{"status": row.status, "count": row.count} for row in result]
+
+
+class ModelUsageStats(NamedTuple):
+    """Per-model task counts"""
+    total_tasks: int
+    completed_tasks: int
+
+
+async def get_model_usage_stats(db: AsyncSession) -> Dict[Optional[str], ModelUsageStats]:
+    """Get usage statistics by AI model"""
+    result = await db.execute(
+        select(
+            Task.model,
+            func.count(Task.id).label('total_tasks'),
+            func.sum(case((Task.status == TaskStatus.COMPLETED, 1), else_=0)).label('completed_tasks')
+        ).group_by(Task.model)
+    )
+
+    return {
+        row.model: ModelUsageStats(row.total_tasks, row.completed_tasks or 0)
+        for row in result
+    }
+
+
+class TaskGroupStats(NamedTuple):
+    """Task counts for one status/model/provider/priority combination"""
+    status: TaskStatus
+    model: Optional[str]
+    provider: Optional[str]
+    priority: int
+    count: int
+    timed_completed: int
+    processing_seconds: float
+
+
+def _task_scope(
+    task_ids: Optional[Sequence[int]],
+    status: Optional[str],
+    created_after: Optional[datetime],
+    limit: Optional[int]
+):
+    """Select the tasks a summary covers: the given IDs in request order, or the newest filtered tasks"""
+    query = select(Task)
+
+    if task_ids is not None:
+        positions: Dict[int, int] = {}
+        for position, task_id in enumerate(task_ids):
+            positions.setdefault(task_id, position)
+        query = query.where(Task.id.in_(positions)).order_by(case(positions, value=Task.id))
+    else:
+        if status:
+            query = query.filter(Task.status == TaskStatus(status.upper()))
+        if created_after:
+            query = query.filter(Task.created_at >= created_after)
+        query = query.order_by(Task.created_at.desc())
+
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def _processing_seconds(dialect_name: str, created_at, updated_at):
+    """Seconds between two timestamp columns; SQLite has no interval type to extract an epoch from"""
+    if dialect_name == "sqlite":
+        return (func.julianday(updated_at) - func.julianday(created_at)) * 86400
+    return func.extract("epoch", updated_at - created_at)
+
+
+async def get_task_group_stats(
+    db: AsyncSession,
+    *,
+    task_ids: Optional[Sequence[int]] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    limit: Optional[int] = None
+) -> List[TaskGroupStats]:
+    """Aggregate the selected tasks by status/model/provider/priority in the database"""
+    if task_ids is not None and not task_ids:
+        return []
+
+    scope = _task_scope(task_ids, status, created_after, limit).subquery()
+    timed_completed = and_(
+        scope.c.status == TaskStatus.COMPLETED,
+        scope.c.created_at.is_not(None),
+        scope.c.updated_at.is_not(None)
+    )
+    seconds = _processing_seconds(db.get_bind().dialect.name, scope.c.created_at, scope.c.updated_at)
+
+    result = await db.execute(
+        select(
+            scope.c.status,
+            scope.c.model,
+            scope.c.provider,
+            scope.c.priority,
+            func.count().label("count"),
+            func.count(case((timed_completed, 1))).label("timed_completed"),
+            func.sum(case((timed_completed, seconds))).label("processing_seconds")
+        ).group_by(scope.c.status, scope.c.model, scope.c.provider, scope.c.priority)
+    )
+
+    return [
+        TaskGroupStats(
+            row.status, row.model, row.provider, row.priority,
+            row.count, row.timed_completed, float(row.processing_seconds or 0)
+        )
+        for row in result
+    ]
+
+
+async def get_task_sample(
+    db: AsyncSession,
+    *,
+    task_ids: Optional[Sequence[int]] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    sample_size: int = 10,
+    include_result: bool = True
+) -> List[Row]:
+    """Get the first few of the tasks get_task_group_stats aggregates, in the same order
+
+    Only the columns a summary shows are loaded, as plain rows; the result
+    text is left in the database unless include_result is set.
+    """
+    if task_ids is not None and not task_ids:
+        return []
+
+    query = _task_scope(task_ids, status, created_after, min(limit or sample_size, sample_size))
+    result = await db.execute(
+        query.with_only_columns(
+            Task.id,
+            Task.prompt,
+            Task.status,
+            Task.model,
+            Task.provider,
+            Task.priority,
+            Task.result if include_result else null().label("result"),
+            maintain_column_froms=True
+        )
+    )
+    return result.all()
+
+
+async def get_task_data_version(db: AsyncSession) -> int:
+    """Counter that changes whenever a task is created, updated or deleted (used to invalidate caches)"""
+    result = await db.execute(select(TaskDataVersion.version).where(TaskDataVersion.id == 1))
+    return result.scalar_one()
+
+
+class SystemStatsBundle(NamedTuple):
+    """Overall task statistics for the system stats resource"""
+    total: int
+    by_status: Dict[TaskStatus, int]
+    last24h_total: int
+    last24h_completed: int
+    last24h_failed: int
+    avg_processing_time: float
+
+
+async def get_system_stats_bundle(db: AsyncSession, hours: int = 24) -> SystemStatsBundle:
+    """Get totals, status counts, recent activity and average processing time in one grouped query"""
+    from datetime import timedelta
+
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    timed = and_(Task.created_at.is_not(None), Task.updated_at.is_not(None))
+    seconds = _processing_seconds(db.get_bind().dialect.name, Task.created_at, Task.updated_at)
+
+    result = await db.execute(
+        select(
+            Task.status,
+            func.count().label("count"),
+            func.count(case((Task.created_at >= cutoff_time, 1))).label("recent"),
+            func.count(case((timed, 1))).label("timed"),
+            func.sum(case((timed, seconds))).label("processing_seconds")
+        ).group_by(Task.status)
+    )
+
+    by_status: Dict[TaskStatus, int] = {}
+    recent: Dict[TaskStatus, int] = {}
+    avg_processing_time = 0.0
+    for row in result:
+        by_status[row.status] = row.count
+        recent[row.status] = row.recent
+        if row.status == TaskStatus.COMPLETED and row.timed:
+            avg_processing_time = float(row.processing_seconds) / row.timed
+
+    return SystemStatsBundle(
+        total=sum(by_status.values()),
+        by_status=by_status,
+        last24h_total=sum(recent.values()),
+        last24h_completed=recent.get(TaskStatus.COMPLETED, 0),
+        last24h_failed=recent.get(TaskStatus.FAILED, 0),
+        avg_processing_time=avg_processing_time
+    )
+
+
+async def get_recent_tasks(db: AsyncSession, hours: int = 24, limit: int = 50) -> List[Task]:
+    """Get recent tasks within specified hours"""
+    from datetime import timedelta
+
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+
+    result = await db.execute(
+        select(Task)
+        .filter(Task.created_at >= cutoff_time)
+        .order_by(Task.created_at.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def get_average_processing_time(db: AsyncSession) -> float:
+    """Get average processing time in seconds"""
+    from sqlalchemy import func
+    from datetime import datetime
+
+    result = await db.execute(
+        select(
+            func.avg(
+                func.extract('epoch', Task.updated_at - Task.created_at)
+            )
+        ).filter(Task.status == TaskStatus.COMPLETED)
+    )
+
+    avg_time = result.scalar()
+    return float(avg_time) if avg_time else 0.0
@@ -0,0 +1,116 @@
+"""
+Synchronous task CRUD used by Celery workers
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, bindparam
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Optional, Union
+import logging
+
+from app.models import Task, TaskDataVersion
+from app.schemas import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Statements built once at import; each call only binds parameters
+_GET_TASK_BY_ID = select(Task).where(Task.id == bindparam("task_id"))
+_UPDATE_STATUS = (
+    update(Task)
+    .where(Task.id == bindparam("task_id"))
+    .values(status=bindparam("new_status"))
+)
+_UPDATE_STATUS_AND_RESULT = (
+    update(Task)
+    .where(Task.id == bindparam("task_id"))
+    .values(status=bindparam("new_status"), result=bindparam("new_result"))
+)
+_BUMP_DATA_VERSION = update(TaskDataVersion).values(version=TaskDataVersion.version + 1)
+
+
+def _normalize_task_id(task_id: Union[int, str]) -> Union[int, str]:
+    """Resolve a task ID to an int when it is numeric, without raising"""
+    if isinstance(task_id, int):
+        return task_id
+    return int(task_id) if task_id.isdecimal() else task_id
+
+
+# 同步版本的CRUD函数，用于Celery任务
+def update_task_status_sync(db: Session, task_id: Union[int, str], status: TaskStatus) -> bool:
+    """Update task status (synchronous version for Celery)"""
+    try:
+        lookup_id = _normalize_task_id(task_id)
+
+        # Single UPDATE; rowcount tells us whether the task existed
+        rows = db.execute(
+            _UPDATE_STATUS, {"task_id": lookup_id, "new_status": status}
+        ).rowcount
+        if rows:
+            db.execute(_BUMP_DATA_VERSION)
+        db.commit()
+        return rows > 0
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error updating task status %s: %s", task_id, e)
+        return False
+    except Exception as e:
+        db.rollback()
+        logger.exception("Unexpected error updating task status %s", task_id)
+        return False
+
+
+def update_task_result_sync(db: Session, task_id: Union[int, str], status: TaskStatus, result: str = None) -> bool:
+    """Update task status and result (synchronous version for Celery)"""
+    try:
+        lookup_id = _normalize_task_id(task_id)
+
+        params = {"task_id": lookup_id, "new_status": status}
+        if result:
+            stmt = _UPDATE_STATUS_AND_RESULT
+            params["new_result"] = result
+        else:
+            stmt = _UPDATE_STATUS
+
+        # Single UPDATE; rowcount tells us whether the task existed
+        rows = db.execute(stmt, params).rowcount
+        if rows:
+            db.execute(_BUMP_DATA_VERSION)
+        db.commit()
+        return rows > 0
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error("Database error updating task result %s: %s", task_id, e)
+        return False
+    except Exception as e:
+        db.rollback()
+        logger.exception("Unexpected error updating task result %s", task_id)
+        return False
+
+
+def get_task_sync(db: Session, task_id: Union[int, str]) -> Optional[Task]:
+    """Get a task by ID (synchronous version for Celery)"""
+    try:
+        lookup_id = _normalize_task_id(task_id)
+        return db.execute(_GET_TASK_BY_ID, {"task_id": lookup_id}).scalar_one_or_none()
+    except SQLAlchemyError as e:
+        logger.error("Database error getting task %s: %s", task_id, e)
+        return None
+    except Exception as e:
+        logger.exception("Unexpected error getting task %s", task_id)
+        return None
+
+
+# 为了向后兼容，保留原来的函数名
+def update_task_status(task_id, status: TaskStatus) -> bool:
+    """Update task status using synchronous database session"""
+    from app.database import get_sync_db_session
+    # Handle both string and integer task IDs
+    with get_sync_db_session() as db:
+        return update_task_status_sync(db, _normalize_task_id(task_id), status)
+
+
+def update_task_result(task_id, status: TaskStatus, result: str = None) -> bool:
+    """Update task result using synchronous database session"""
+    from app.database import get_sync_db_session
+    # Handle both string and integer task IDs
+    with get_sync_db_session() as db:
+        return update_task_result_sync(db, _normalize_task_id(task_id), status, result)
@@ -1,19 +1,102 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
-from app.core.config_fixed import settings
+from sqlalchemy.pool import StaticPool
+from app.core.config import settings
+from typing import AsyncIterator, Optional, Tuple
+import asyncio
 import contextlib
+import contextvars
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_options(database_url: str) -> dict:
+    """Connection pool options shared by the async and sync engines"""
+    # SQLite serializes writes on the file lock anyway, so extra connections only
+    # add driver threads; keep a single tuned connection instead
+    if database_url.startswith("sqlite"):
+        if "mode=memory" in database_url:
+            return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+        # Sessions queue for the one connection rather than sharing it mid-transaction
+        return {"pool_size": 1, "max_overflow": 0, "pool_timeout": settings.db_pool_timeout}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+
+SQLITE_SHARED_MEMORY_URL = "sqlite+aiosqlite:///file:app?mode=memory&cache=shared&uri=true"
+
+
+def _resolve_database_url(database_url: str) -> str:
+    """Point in-memory SQLite URLs at one shared-cache database
+
+    A plain :memory: URL gives every new connection its own empty
+    database, so the async pool and the sync engine in this process would
+    never see each other's tables. Sharing stops at the process boundary:
+    Celery workers run in their own processes and can never see it.
+    """
+    if database_url in ("sqlite+aiosqlite://", "sqlite+aiosqlite:///:memory:"):
+        return SQLITE_SHARED_MEMORY_URL
+    return database_url
+
+
+def is_in_memory_database(database_url: str) -> bool:
+    """Whether the URL names an in-memory SQLite database, private to one process"""
+    return database_url.startswith("sqlite") and (
+        "mode=memory" in database_url
+        or ":memory:" in database_url
+        or database_url.rstrip("/").endswith(":")
+    )
+
+
+database_url = _resolve_database_url(settings.database_url)
+
+if is_in_memory_database(database_url) and settings.celery_broker_url:
+    logger.warning(
+        "In-memory SQLite database configured while Celery is enabled; "
+        "workers run in separate processes and will not see tasks created here"
+    )
+
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply WAL and cache tuning to every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 # Create async engine
 engine = create_async_engine(
-    settings.database_url,
+    database_url,
     echo=settings.debug,
-    future=True
+    future=True,
+    **_pool_options(database_url),
 )
 
+if database_url.startswith("sqlite"):
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
 # Create async session factory
-AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    engine, expire_on_commit=False, autoflush=False
 )
 
 # Base class for models
@@ -22,24 +105,36 @@ class Base(DeclarativeBase):
 
 
 async def get_db() -> AsyncSession:
-    """Dependency to get database session"""
+    """Dependency to get database session
+
+    Session lifecycle only. Code after the yield may run after the response
+    has been sent, so it must not commit: handlers that write commit
+    explicitly before returning, and a failed commit becomes an error
+    response. Anything left uncommitted is rolled back when the session closes.
+    """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 # Convert async URL to sync URL for Celery tasks
-sync_database_url = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+# SQLite goes straight through the stdlib sqlite3 driver, not aiosqlite
+sync_database_url = (
+    database_url
+    .replace("postgresql+asyncpg://", "postgresql://")
+    .replace("sqlite+aiosqlite://", "sqlite://")
+)
 
-# Create sync engine for Celery tasks
+# Create sync engine for Celery tasks (one pooled engine per worker process)
 sync_engine = create_engine(
     sync_database_url,
     echo=settings.debug,
+    **_pool_options(sync_database_url),
 )
 
-# Create sync session factory for Celery tasks
+if sync_database_url.startswith("sqlite"):
+    event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+
+# Create sync session factory for Celery tasks, reused by every task call
 SyncSessionLocal = sessionmaker(
     sync_engine, autocommit=False, autoflush=False
 )
@@ -58,9 +153,35 @@ def get_sync_db_session():
         session.close()
 
 
-async def get_db_session():
-    """Get async database session (helper function)"""
-    return AsyncSessionLocal()
+# Session opened by the outermost get_db_session() block, with the task that owns it
+_current_db_session: contextvars.ContextVar[Optional[Tuple[AsyncSession, asyncio.Task]]] = (
+    contextvars.ContextVar("current_db_session", default=None)
+)
+
+
+@contextlib.asynccontextmanager
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """Get async database session (helper function)
+
+    Nested blocks in the same asyncio task reuse the outer session instead of
+    checking out another connection; tasks spawned with gather() get their own,
+    since a session cannot run statements concurrently.
+    """
+    current = _current_db_session.get()
+    task = asyncio.current_task()
+    if current is not None and current[1] is task:
+        yield current[0]
+        return
+
+    async with AsyncSessionLocal() as session:
+        token = _current_db_session.set((session, task))
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            _current_db_session.reset(token)
 
 
 async def init_db():
@@ -70,4 +191,24 @@ async def init_db():
         from app.models import Task
 
         # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_up_pool(connections: int) -> None:
+    """Open pooled connections up front so early requests don't pay for them"""
+    # SQLite has no network handshake to amortize; one ping checks the file opens
+    if database_url.startswith("sqlite"):
+        connections = 1
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(connections):
+            tg.create_task(_ping())
+
+
+async def close_db():
+    """Close all pooled connections"""
+    await engine.dispose()
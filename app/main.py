@@ -1,22 +1,35 @@
-from fastapi import FastAPI, Depends
+import logging
+from fastapi import FastAPI, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from app.core.config_fixed import settings
+from sqlalchemy.exc import SQLAlchemyError
+from app.core.config import settings
+from app.core.logging_config import queue_logging
 from app.api.v1.api import api_router
-from app.database import init_db
+from app.database import close_db, init_db, warm_up_pool
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    print("=Starting Async AI Task Runner...")
-    await init_db()
-    print("Database initialized")
+    # Log records are queued by request handlers and written by a background
+    # listener; the queue handler is only installed while the app is running
+    with queue_logging(settings.log_level):
+        # Startup
+        print("=Starting Async AI Task Runner...")
+        if settings.run_init_db:
+            await init_db()
+            print("Database initialized")
+        await warm_up_pool(settings.db_pool_size)
+        print("Database connection pool warmed up")
 
-    yield
+        yield
 
-    # Shutdown
-    print("=K Shutting down Async AI Task Runner...")
+        # Shutdown
+        print("=K Shutting down Async AI Task Runner...")
+        await close_db()
 
 
 app = FastAPI(
@@ -26,6 +39,7 @@ app = FastAPI(
     openapi_url=f"{settings.api_v1_str}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson serializes responses much faster than stdlib json
     lifespan=lifespan
 )
 
@@ -38,6 +52,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(SQLAlchemyError)
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
+    """Return a 500 for unhandled database errors"""
+    logger.exception("Database error on %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Database error"}
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Return a 500 for any other unhandled error"""
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"}
+    )
+
+
 # Include API routes
 app.include_router(api_router, prefix=settings.api_v1_str)
 
@@ -5,8 +5,22 @@ Configuration settings for Model Context Protocol server integration
 with Async AI Task Runner.
 """
 
-from typing import Dict, Any, Optional, List
-from pydantic import Field
+import functools
+import operator
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+
+import orjson
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only views and turn lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 class MCPServerSettings:
@@ -32,10 +46,12 @@ class MCPServerSettings:
     # Resource limits
     max_tasks_per_request: int = 100
     default_task_limit: int = 10
+    prompt_cache_ttl: int = 30  # seconds; 0 disables prompt caching
+    resource_cache_ttl: int = 3  # seconds; 0 disables caching of DB-backed resources
 
-    # Security settings
-    allowed_models: List[str] = ["deepseek-chat", "gpt-3.5-turbo", "gpt-4", "claude-3-sonnet"]
-    allowed_providers: List[str] = ["deepseek", "openai", "anthropic"]
+    # Security settings (frozensets: O(1) membership checks, immutable shared defaults)
+    allowed_models: FrozenSet[str] = frozenset({"deepseek-chat", "gpt-3.5-turbo", "gpt-4", "claude-3-sonnet"})
+    allowed_providers: FrozenSet[str] = frozenset({"deepseek", "openai", "anthropic"})
 
     # Logging settings
     log_level: str = "INFO"
@@ -47,16 +63,38 @@ class MCPServerSettings:
     enable_task_listing: bool = True
     enable_task_result_access: bool = True
 
+    # Names of the overridable settings above, computed once from the annotations
+    _FIELDS = frozenset(__annotations__)
+
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self._FIELDS:
                 setattr(self, key, value)
 
 
-class MCPResourceDefinitions:
-    """MCP Resource definitions for the task runner"""
+@dataclass(frozen=True, slots=True)
+class TaskStatusInfo:
+    """Static description of a task status"""
+    description: str
+    color: str
+    user_visible: bool
+
 
-    TASK_SCHEMA = {
+@dataclass(frozen=True, slots=True)
+class ModelInfo:
+    """Static description of a supported AI model"""
+    name: str
+    description: str
+    provider: str
+    cost_per_token: float
+    context_window: int
+    recommended_for: Tuple[str, ...]
+
+
+def _build_task_schema() -> Dict[str, Any]:
+    """Build the task JSON schema from the MCPServerSettings defaults"""
+    defaults = MCPServerSettings
+    return {
         "type": "object",
         "properties": {
             "id": {"type": "integer", "description": "Unique task identifier"},
@@ -64,17 +102,17 @@ class MCPResourceDefinitions:
                 "type": "string",
                 "description": "AI prompt to process",
                 "minLength": 1,
-                "maxLength": 1000
+                "maxLength": defaults.max_task_prompt_length
             },
             "model": {
                 "type": "string",
                 "description": "AI model to use",
-                "enum": ["deepseek-chat", "gpt-3.5-turbo", "gpt-4", "claude-3-sonnet"]
+                "enum": sorted(defaults.allowed_models)
             },
             "provider": {
                 "type": "string",
                 "description": "AI provider to use",
-                "enum": ["deepseek", "openai", "anthropic"]
+                "enum": sorted(defaults.allowed_providers)
             },
             "status": {
                 "type": "string",
@@ -83,9 +121,9 @@ class MCPResourceDefinitions:
             },
             "priority": {
                 "type": "integer",
-                "description": "Task priority (1-10, higher is more urgent)",
+                "description": f"Task priority (1-{defaults.max_priority}, higher is more urgent)",
                 "minimum": 1,
-                "maximum": 10
+                "maximum": defaults.max_priority
             },
             "result": {"type": "string", "description": "AI generated result (when completed)"},
             "created_at": {"type": "string", "format": "date-time", "description": "Task creation time"},
@@ -94,63 +132,112 @@ class MCPResourceDefinitions:
         "required": ["id", "prompt", "model", "provider", "status", "priority", "created_at", "updated_at"]
     }
 
-    TASK_STATUSES = {
-        "PENDING": {
-            "description": "Task created, waiting to be processed",
-            "color": "#FFA500",  # Orange
-            "user_visible": True
-        },
-        "PROCESSING": {
-            "description": "Task is currently being processed by AI",
-            "color": "#007BFF",  # Blue
-            "user_visible": True
-        },
-        "COMPLETED": {
-            "description": "Task completed successfully with AI result",
-            "color": "#28A745",  # Green
-            "user_visible": True
-        },
-        "FAILED": {
-            "description": "Task processing failed with error",
-            "color": "#DC3545",  # Red
-            "user_visible": True
-        }
-    }
 
-    AVAILABLE_MODELS = {
-        "deepseek": {
-            "name": "deepseek-chat",
-            "description": "DeepSeek AI chat model",
-            "provider": "deepseek",
-            "cost_per_token": 0.000001,
-            "context_window": 32768,
-            "recommended_for": ["general_qa", "coding", "analysis"]
-        },
-        "openai": {
-            "name": "gpt-3.5-turbo",
-            "description": "OpenAI GPT-3.5 Turbo model",
-            "provider": "openai",
-            "cost_per_token": 0.000002,
-            "context_window": 16384,
-            "recommended_for": ["general_qa", "creative_writing"]
-        },
-        "openai_gpt4": {
-            "name": "gpt-4",
-            "description": "OpenAI GPT-4 model",
-            "provider": "openai",
-            "cost_per_token": 0.00003,
-            "context_window": 32768,
-            "recommended_for": ["complex_analysis", "coding", "research"]
-        }
-    }
+# MCP resource definitions for the task runner (read-only; copy before extending)
+TASK_SCHEMA = _freeze(_build_task_schema())
 
+TASK_STATUSES = MappingProxyType({
+    "PENDING": TaskStatusInfo(
+        description="Task created, waiting to be processed",
+        color="#FFA500",  # Orange
+        user_visible=True
+    ),
+    "PROCESSING": TaskStatusInfo(
+        description="Task is currently being processed by AI",
+        color="#007BFF",  # Blue
+        user_visible=True
+    ),
+    "COMPLETED": TaskStatusInfo(
+        description="Task completed successfully with AI result",
+        color="#28A745",  # Green
+        user_visible=True
+    ),
+    "FAILED": TaskStatusInfo(
+        description="Task processing failed with error",
+        color="#DC3545",  # Red
+        user_visible=True
+    )
+})
 
-# Global settings instance
-mcp_settings = MCPServerSettings()
+AVAILABLE_MODELS = MappingProxyType({
+    "deepseek": ModelInfo(
+        name="deepseek-chat",
+        description="DeepSeek AI chat model",
+        provider="deepseek",
+        cost_per_token=0.000001,
+        context_window=32768,
+        recommended_for=("general_qa", "coding", "analysis")
+    ),
+    "openai": ModelInfo(
+        name="gpt-3.5-turbo",
+        description="OpenAI GPT-3.5 Turbo model",
+        provider="openai",
+        cost_per_token=0.000002,
+        context_window=16384,
+        recommended_for=("general_qa", "creative_writing")
+    ),
+    "openai_gpt4": ModelInfo(
+        name="gpt-4",
+        description="OpenAI GPT-4 model",
+        provider="openai",
+        cost_per_token=0.00003,
+        context_window=32768,
+        recommended_for=("complex_analysis", "coding", "research")
+    )
+})
 
 
-def get_mcp_config() -> Dict[str, Any]:
-    """Get complete MCP configuration as dictionary"""
+class MCPResourceDefinitions:
+    """Deprecated namespace for the resource definitions; import the module constants instead"""
+
+    TASK_SCHEMA = TASK_SCHEMA
+    TASK_STATUSES = TASK_STATUSES
+    AVAILABLE_MODELS = AVAILABLE_MODELS
+
+
+# Global settings instance, created on first access (see __getattr__ below)
+_mcp_settings: Optional[MCPServerSettings] = None
+
+
+def _get_settings() -> MCPServerSettings:
+    """Return the shared MCPServerSettings, constructing it on first use"""
+    global _mcp_settings
+    if _mcp_settings is None:
+        _mcp_settings = MCPServerSettings()
+    return _mcp_settings
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``mcp_settings`` lazily so importing this module stays cheap"""
+    if name == "mcp_settings":
+        return _get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_sorted_allowed_values() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Allowed models and providers as sorted tuples (sorted once; for display and schema enums)"""
+    settings = _get_settings()
+    return tuple(sorted(settings.allowed_models)), tuple(sorted(settings.allowed_providers))
+
+
+@functools.lru_cache(maxsize=1)
+def _error_messages() -> Dict[str, str]:
+    """Validation error messages derived from the settings, formatted once"""
+    settings = _get_settings()
+    allowed_models, allowed_providers = get_sorted_allowed_values()
+    return {
+        "prompt_too_long": f"Prompt too long (max {settings.max_task_prompt_length} characters)",
+        "model_not_allowed": "Model '{}' not allowed. Allowed: " + ", ".join(allowed_models),
+        "provider_not_allowed": "Provider '{}' not allowed. Allowed: " + ", ".join(allowed_providers),
+        "priority_out_of_range": f"Priority must be between 1 and {settings.max_priority}"
+    }
+
+
+def _build_mcp_config() -> Dict[str, Any]:
+    """Assemble the MCP configuration dictionary from the current settings"""
+    mcp_settings = _get_settings()
+    allowed_models, allowed_providers = get_sorted_allowed_values()
     return {
         "server": {
             "name": mcp_settings.server_name,
@@ -174,8 +261,8 @@ def get_mcp_config() -> Dict[str, Any]:
             "default_task_limit": mcp_settings.default_task_limit
         },
         "security": {
-            "allowed_models": mcp_settings.allowed_models,
-            "allowed_providers": mcp_settings.allowed_providers
+            "allowed_models": list(allowed_models),
+            "allowed_providers": list(allowed_providers)
         },
         "features": {
             "enable_task_creation": mcp_settings.enable_task_creation,
@@ -186,31 +273,70 @@ def get_mcp_config() -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def get_mcp_config_json() -> bytes:
+    """Get the MCP configuration pre-serialized as indented JSON bytes (serialized once)"""
+    return orjson.dumps(_build_mcp_config(), option=orjson.OPT_INDENT_2)
+
+
+def get_mcp_config() -> Dict[str, Any]:
+    """Get complete MCP configuration as a plain dict
+
+    Built from the cached JSON, so each caller gets its own copy and
+    mutating it cannot leak into later calls.
+    """
+    return orjson.loads(get_mcp_config_json())
+
+
+def reset_mcp_config() -> None:
+    """Drop the cached configuration after changing mcp_settings at runtime"""
+    get_mcp_config_json.cache_clear()
+    get_sorted_allowed_values.cache_clear()
+    _error_messages.cache_clear()
+
+
+# Sentinel for parameters absent from the request
+_MISSING = object()
+
+
 def validate_task_params(params: Dict[str, Any]) -> tuple[bool, Optional[str]]:
     """Validate task creation parameters"""
-    if "prompt" not in params:
+    prompt = params.get("prompt", _MISSING)
+    if prompt is _MISSING:
         return False, "Prompt is required"
 
-    prompt = params["prompt"]
-    if not isinstance(prompt, str) or len(prompt.strip()) == 0:
+    mcp_settings = _get_settings()
+
+    if not isinstance(prompt, str):
         return False, "Prompt must be a non-empty string"
 
-    if len(prompt) > mcp_settings.max_task_prompt_length:
-        return False, f"Prompt too long (max {mcp_settings.max_task_prompt_length} characters)"
+    # Length first, then isspace(): neither copies the prompt the way strip() does
+    prompt_length = len(prompt)
+    if prompt_length > mcp_settings.max_task_prompt_length:
+        return False, _error_messages()["prompt_too_long"]
+
+    if prompt_length == 0 or prompt.isspace():
+        return False, "Prompt must be a non-empty string"
 
-    if "model" in params:
-        model = params["model"]
-        if model not in mcp_settings.allowed_models:
-            return False, f"Model '{model}' not allowed. Allowed: {mcp_settings.allowed_models}"
+    # Only strings can be allowed; checking first also keeps unhashable values out of the frozensets
+    model = params.get("model", _MISSING)
+    if model is not _MISSING and (not isinstance(model, str) or model not in mcp_settings.allowed_models):
+        return False, _error_messages()["model_not_allowed"].format(model)
 
-    if "provider" in params:
-        provider = params["provider"]
-        if provider not in mcp_settings.allowed_providers:
-            return False, f"Provider '{provider}' not allowed. Allowed: {mcp_settings.allowed_providers}"
+    provider = params.get("provider", _MISSING)
+    if provider is not _MISSING and (
+        not isinstance(provider, str) or provider not in mcp_settings.allowed_providers
+    ):
+        return False, _error_messages()["provider_not_allowed"].format(provider)
 
-    if "priority" in params:
-        priority = params["priority"]
-        if not isinstance(priority, int) or priority < 1 or priority > mcp_settings.max_priority:
-            return False, f"Priority must be between 1 and {mcp_settings.max_priority}"
+    priority = params.get("priority", _MISSING)
+    if priority is not _MISSING:
+        # operator.index also accepts int-like values (IntEnum, numpy integers)
+        try:
+            priority = operator.index(priority)
+        except TypeError:
+            return False, _error_messages()["priority_out_of_range"]
+        if not 1 <= priority <= mcp_settings.max_priority:
+            return False, _error_messages()["priority_out_of_range"]
 
-    return True, None
\ No newline at end of file
+    return True, None
@@ -5,16 +5,20 @@ Prompt templates and generators exposed through Model Context Protocol
 for external AI systems to generate contextual responses.
 """
 
-from .task_prompts import (
-    task_summary_prompt,
-    system_health_prompt,
-    task_analysis_prompt,
-    performance_review_prompt
-)
-
 __all__ = [
     "task_summary_prompt",
     "system_health_prompt",
     "task_analysis_prompt",
     "performance_review_prompt"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # Load task_prompts (and its database/CRUD imports) only on first use
+    if name in __all__:
+        from . import task_prompts
+
+        value = getattr(task_prompts, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
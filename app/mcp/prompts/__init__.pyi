@@ -0,0 +1,8 @@
+from typing import Any, Dict, List, Optional
+
+__all__: List[str]
+
+async def task_summary_prompt(arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
+async def system_health_prompt(arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
+async def task_analysis_prompt(arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
+async def performance_review_prompt(arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]: ...
@@ -0,0 +1,50 @@
+"""
+Prompt result cache
+
+Small in-process LRU cache for generated prompts. Entries expire after a
+TTL and are dropped early when the task table's version stamp changes.
+Payloads are deep-copied on the way in and out, so callers that mutate
+a returned prompt cannot change what later callers receive.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class PromptCache:
+    """LRU cache of prompt payloads validated against a data version stamp"""
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Hashable, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached payload, or None if missing, expired or built from older data"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, cached_version, value = entry
+        if expires_at < time.monotonic() or cached_version != version:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, version: Hashable, value: Dict[str, Any]) -> None:
+        """Store a payload for this key and data version"""
+        if self.ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, version, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached payload"""
+        self._entries.clear()
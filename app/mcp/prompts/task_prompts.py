@@ -5,17 +5,69 @@ Prompt templates and generators for task analysis, summaries,
 and system insights through Model Context Protocol.
 """
 
-import json
+import functools
 import logging
-from datetime import datetime, timedelta
+import operator
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from app.database import get_db_session
 from app.crud import task as task_crud
 from app.mcp.config import mcp_settings
+from app.mcp.prompts._cache import PromptCache
 
 logger = logging.getLogger(__name__)
 
+# Position of each outcome in the [total, completed, failed] counters
+_OUTCOME_INDEX = {"COMPLETED": 1, "FAILED": 2}
+
+# Table header separators for the labels the summary uses
+_TABLE_SEPARATORS = {label: "|" + "-" * (len(label) + 35) + "|" for label in ("Model", "Provider")}
+
+# Generated summaries, reused until the TTL passes or the task data changes
+_summary_cache = PromptCache(ttl=mcp_settings.prompt_cache_ttl)
+
+
+# (metric, "worse than" test, issue threshold, penalty, message, warning threshold, penalty, message)
+_HEALTH_RULES = (
+    ("completion_rate", operator.lt, 90, 20, "Low completion rate: {}%", 95, 10, "Moderate completion rate: {}%"),
+    ("average_processing_time", operator.gt, 300, 15, "Slow average processing time: {}s", 180, 5, "Moderate processing time: {}s"),
+    ("error_rate", operator.gt, 10, 25, "High error rate: {}%", 5, 10, "Moderate error rate: {}%"),
+)
+
+# Seconds per time_range unit: "24h", "7d", "30m"
+_TIME_UNITS = {"h": 3600, "d": 86400, "m": 60}
+
+
+def _parse_time_range(time_range: Optional[str]) -> Optional[datetime]:
+    """Turn a time_range like "24h" into a UTC cutoff; None for no or unknown range"""
+    if not time_range:
+        return None
+    seconds = _TIME_UNITS.get(time_range[-1])
+    if seconds is None:
+        return None
+    return datetime.now(timezone.utc) - timedelta(seconds=int(time_range[:-1]) * seconds)
+
+
+def _result_preview(result: Optional[str]) -> Optional[str]:
+    """Task result shortened to 200 characters; None when empty"""
+    if not result:
+        return None
+    return result[:200] + "..." if len(result) > 200 else result
+
+
+def _no_result(result: Optional[str]) -> None:
+    """Result preview used when the caller did not ask for results"""
+    return None
+
+
+def _generated_at() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
 
 class TaskPromptsMixin:
     """Mixin class providing task-related prompts"""
@@ -44,61 +96,48 @@ class TaskPromptsMixin:
             time_range = args.get("time_range")
             include_results = args.get("include_results", False)
 
-            # Get tasks
+            # Aggregate the selected tasks in the database; only a small sample is loaded as rows
             async with get_db_session() as db:
-                tasks = []
+                cache_key = orjson.dumps(
+                    args, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                )
+                data_version = await task_crud.get_task_data_version(db)
+                cached = _summary_cache.get(cache_key, data_version)
+                if cached is not None:
+                    return cached
+
+                scope: Dict[str, Any] = {}
 
                 if task_ids_str:
                     # Specific task IDs
                     try:
-                        task_ids = [int(id.strip()) for id in task_ids_str.split(",") if id.strip()]
-                        for task_id in task_ids:
-                            task = await task_crud.get_task(db=db, task_id=task_id)
-                            if task:
-                                tasks.append(task)
+                        scope["task_ids"] = [int(id.strip()) for id in task_ids_str.split(",") if id.strip()]
                     except ValueError:
                         logger.warning(f"Invalid task IDs format: {task_ids_str}")
+                        scope["task_ids"] = []
 
                 elif status_filter or time_range:
                     # Filtered tasks
-                    skip = 0
-                    limit = mcp_settings.max_tasks_per_request
-
-                    # Apply time range filter
-                    if time_range:
-                        if time_range.endswith("h"):
-                            hours = int(time_range[:-1])
-                            cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-                        elif time_range.endswith("d"):
-                            days = int(time_range[:-1])
-                            cutoff_time = datetime.utcnow() - timedelta(days=days)
-                        elif time_range.endswith("m"):
-                            minutes = int(time_range[:-1])
-                            cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
-                        else:
-                            cutoff_time = None
-                    else:
-                        cutoff_time = None
-
-                    tasks = await task_crud.get_tasks_with_filters(
-                        db=db,
-                        skip=skip,
-                        limit=limit,
-                        status=status_filter,
-                        created_after=cutoff_time
-                    )
+                    scope["limit"] = mcp_settings.max_tasks_per_request
+
+                    scope["status"] = status_filter
+                    scope["created_after"] = _parse_time_range(time_range)
 
                 else:
                     # Default to recent tasks
-                    tasks = await task_crud.get_recent_tasks(db, hours=24, limit=50)
+                    scope["created_after"] = _parse_time_range("24h")
+                    scope["limit"] = 50
+
+                group_stats = await task_crud.get_task_group_stats(db, **scope)
+                recent_tasks = await task_crud.get_task_sample(db, include_result=include_results, **scope)
 
                 # Generate summary data
-                summary_data = self._generate_task_summary_data(tasks, include_results)
+                summary_data = self._generate_task_summary_data(group_stats, recent_tasks, include_results)
 
                 # Build prompt template
                 prompt_template = self._build_task_summary_prompt(summary_data, args)
 
-                return {
+                response = {
                     "name": "task_summary",
                     "description": "Generate a summary of task execution and performance",
                     "arguments": {
@@ -106,12 +145,14 @@ class TaskPromptsMixin:
                         "status_filter": status_filter or "All statuses",
                         "time_range": time_range or "All time",
                         "include_results": include_results,
-                        "total_tasks_analyzed": len(tasks)
+                        "total_tasks_analyzed": summary_data["overview"]["total_tasks"]
                     },
                     "template": prompt_template,
                     "data": summary_data,
-                    "generated_at": datetime.utcnow().isoformat() + "Z"
+                    "generated_at": _generated_at()
                 }
+                _summary_cache.set(cache_key, data_version, response)
+                return response
 
         except Exception as e:
             logger.error(f"Error generating task summary prompt: {e}")
@@ -165,7 +206,7 @@ class TaskPromptsMixin:
                     "template": prompt_template,
                     "health_data": health_data,
                     "health_assessment": health_assessment,
-                    "generated_at": datetime.utcnow().isoformat() + "Z"
+                    "generated_at": _generated_at()
                 }
 
         except Exception as e:
@@ -225,7 +266,7 @@ class TaskPromptsMixin:
                     },
                     "template": prompt_template,
                     "analysis_data": analysis_data,
-                    "generated_at": datetime.utcnow().isoformat() + "Z"
+                    "generated_at": _generated_at()
                 }
 
         except Exception as e:
@@ -287,7 +328,7 @@ class TaskPromptsMixin:
                     "template": prompt_template,
                     "performance_data": performance_data,
                     "performance_insights": performance_insights,
-                    "generated_at": datetime.utcnow().isoformat() + "Z"
+                    "generated_at": _generated_at()
                 }
 
         except Exception as e:
@@ -299,76 +340,84 @@ class TaskPromptsMixin:
             }
 
     def _generate_task_summary_data(
-        self, tasks: List[Any], include_results: bool
+        self, group_stats: List[Any], recent_tasks: List[Any], include_results: bool
     ) -> Dict[str, Any]:
-        """Generate summary data from tasks"""
+        """Generate summary data from per-group task counts and a sample of tasks"""
         status_counts = {"PENDING": 0, "PROCESSING": 0, "COMPLETED": 0, "FAILED": 0}
-        model_performance = {}
-        provider_performance = {}
-        priority_distribution = {}
+        # [total, completed, failed] per model / provider
+        model_counts = defaultdict(lambda: [0, 0, 0])
+        provider_counts = defaultdict(lambda: [0, 0, 0])
+        priority_counts = Counter()
 
+        total_tasks = 0
         total_processing_time = 0
         completed_tasks = 0
-        recent_tasks = []
 
-        for task in tasks:
+        for group in group_stats:
+            count = group.count
+            total_tasks += count
+
             # Status counts
-            if task.status in status_counts:
-                status_counts[task.status] += 1
-
-            # Model performance
-            if task.model not in model_performance:
-                model_performance[task.model] = {"total": 0, "completed": 0, "failed": 0}
-            model_performance[task.model]["total"] += 1
-            if task.status == "COMPLETED":
-                model_performance[task.model]["completed"] += 1
-            elif task.status == "FAILED":
-                model_performance[task.model]["failed"] += 1
-
-            # Provider performance
-            if task.provider not in provider_performance:
-                provider_performance[task.provider] = {"total": 0, "completed": 0, "failed": 0}
-            provider_performance[task.provider]["total"] += 1
-            if task.status == "COMPLETED":
-                provider_performance[task.provider]["completed"] += 1
-            elif task.status == "FAILED":
-                provider_performance[task.provider]["failed"] += 1
+            if group.status in status_counts:
+                status_counts[group.status] += count
+
+            # Model and provider performance
+            model_stats = model_counts[group.model]
+            provider_stats = provider_counts[group.provider]
+            model_stats[0] += count
+            provider_stats[0] += count
+            outcome = _OUTCOME_INDEX.get(group.status)
+            if outcome is not None:
+                model_stats[outcome] += count
+                provider_stats[outcome] += count
 
             # Priority distribution
-            priority_key = f"Priority_{task.priority}"
-            priority_distribution[priority_key] = priority_distribution.get(priority_key, 0) + 1
+            priority_counts[group.priority] += count
 
             # Processing time analysis
-            if task.status == "COMPLETED" and task.created_at and task.updated_at:
-                processing_time = (task.updated_at - task.created_at).total_seconds()
-                total_processing_time += processing_time
-                completed_tasks += 1
-
-            # Recent tasks (last 10)
-            if len(recent_tasks) < 10:
-                recent_tasks.append({
-                    "id": task.id,
-                    "prompt": task.prompt[:100] + "..." if len(task.prompt) > 100 else task.prompt,
-                    "status": task.status,
-                    "model": task.model,
-                    "provider": task.provider,
-                    "priority": task.priority,
-                    "result": task.result[:200] + "..." if (include_results and task.result and len(task.result) > 200) else (task.result if include_results and task.result else None)
-                })
+            total_processing_time += group.processing_seconds
+            completed_tasks += group.timed_completed
+
+        model_performance = {
+            model: {"total": total, "completed": completed, "failed": failed}
+            for model, (total, completed, failed) in model_counts.items()
+        }
+        provider_performance = {
+            provider: {"total": total, "completed": completed, "failed": failed}
+            for provider, (total, completed, failed) in provider_counts.items()
+        }
+        priority_distribution = {
+            f"Priority_{priority}": count for priority, count in priority_counts.items()
+        }
+
+        # Recent tasks (sample of up to 10); include_results is decided once, not per row
+        result_preview = _result_preview if include_results else _no_result
+        recent = [
+            {
+                "id": task.id,
+                "prompt": task.prompt[:100] + "..." if len(task.prompt) > 100 else task.prompt,
+                "status": task.status,
+                "model": task.model,
+                "provider": task.provider,
+                "priority": task.priority,
+                "result": result_preview(task.result)
+            }
+            for task in recent_tasks
+        ]
 
         avg_processing_time = total_processing_time / completed_tasks if completed_tasks > 0 else 0
 
         return {
             "overview": {
-                "total_tasks": len(tasks),
+                "total_tasks": total_tasks,
                 "status_breakdown": status_counts,
                 "average_processing_time_seconds": round(avg_processing_time, 2),
-                "completion_rate": round((status_counts["COMPLETED"] / len(tasks) * 100) if len(tasks) > 0 else 0, 2)
+                "completion_rate": round((status_counts["COMPLETED"] / total_tasks * 100) if total_tasks > 0 else 0, 2)
             },
             "model_performance": model_performance,
             "provider_performance": provider_performance,
             "priority_distribution": priority_distribution,
-            "recent_tasks": recent_tasks
+            "recent_tasks": recent
         }
 
     def _build_task_summary_prompt(
@@ -427,32 +476,16 @@ Focus on patterns, anomalies, and actionable insights that could help optimize t
             "recommendations": []
         }
 
-        # Check completion rate
-        completion_rate = health_data["performance"]["completion_rate"]
-        if completion_rate < 90:
-            assessment["issues"].append(f"Low completion rate: {completion_rate}%")
-            assessment["score"] -= 20
-        elif completion_rate < 95:
-            assessment["warnings"].append(f"Moderate completion rate: {completion_rate}%")
-            assessment["score"] -= 10
-
-        # Check processing time
-        avg_time = health_data["performance"]["average_processing_time"]
-        if avg_time > 300:  # 5 minutes
-            assessment["issues"].append(f"Slow average processing time: {avg_time}s")
-            assessment["score"] -= 15
-        elif avg_time > 180:  # 3 minutes
-            assessment["warnings"].append(f"Moderate processing time: {avg_time}s")
-            assessment["score"] -= 5
-
-        # Check error rate
-        error_rate = health_data["performance"]["error_rate"]
-        if error_rate > 10:
-            assessment["issues"].append(f"High error rate: {error_rate}%")
-            assessment["score"] -= 25
-        elif error_rate > 5:
-            assessment["warnings"].append(f"Moderate error rate: {error_rate}%")
-            assessment["score"] -= 10
+        # Threshold checks: the worse band adds an issue, the milder one a warning
+        performance = health_data["performance"]
+        for metric, worse, issue_at, issue_penalty, issue_msg, warn_at, warn_penalty, warn_msg in _HEALTH_RULES:
+            value = performance[metric]
+            if worse(value, issue_at):
+                assessment["issues"].append(issue_msg.format(value))
+                assessment["score"] -= issue_penalty
+            elif worse(value, warn_at):
+                assessment["warnings"].append(warn_msg.format(value))
+                assessment["score"] -= warn_penalty
 
         # Check for no recent activity
         recent_activity = health_data.get("recent_activity", {})
@@ -475,36 +508,35 @@ Focus on patterns, anomalies, and actionable insights that could help optimize t
         if not performance_data:
             return f"No {label.lower()} data available."
 
-        lines = [f"| {label} | Total | Completed | Failed | Success Rate |"]
-        lines.append("|" + "-" * (len(label) + 35) + "|")
-
-        for name, stats in performance_data.items():
-            success_rate = (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            lines.append(f"| {name} | {stats['total']} | {stats['completed']} | {stats['failed']} | {success_rate:.1f}% |")
-
-        return "\n".join(lines)
+        header = (
+            f"| {label} | Total | Completed | Failed | Success Rate |\n"
+            + (_TABLE_SEPARATORS.get(label) or "|" + "-" * (len(label) + 35) + "|")
+        )
+        rows = "\n".join(
+            f"| {name} | {stats['total']} | {stats['completed']} | {stats['failed']} | "
+            f"{(stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0:.1f}% |"
+            for name, stats in performance_data.items()
+        )
+        return f"{header}\n{rows}"
 
     def _format_priority_distribution(self, priority_data: Dict[str, Any]) -> str:
         """Format priority distribution"""
         if not priority_data:
             return "No priority data available."
 
-        lines = ["Priority Distribution:"]
-        for priority, count in sorted(priority_data.items()):
-            lines.append(f"- {priority}: {count}")
-
-        return "\n".join(lines)
+        return "Priority Distribution:\n" + "\n".join(
+            f"- {priority}: {count}" for priority, count in sorted(priority_data.items())
+        )
 
     def _format_recent_tasks(self, recent_tasks: List[Dict[str, Any]]) -> str:
         """Format recent tasks"""
         if not recent_tasks:
             return "No recent tasks to display."
 
-        lines = ["Recent Tasks:"]
-        for task in recent_tasks:
-            lines.append(f"ID {task['id']} [{task['status']}] ({task['model']}/{task['provider']}): {task['prompt']}")
-
-        return "\n".join(lines)
+        return "Recent Tasks:\n" + "\n".join(
+            f"ID {task['id']} [{task['status']}] ({task['model']}/{task['provider']}): {task['prompt']}"
+            for task in recent_tasks
+        )
 
 
 # Prompt instance
@@ -531,9 +563,10 @@ async def performance_review_prompt(arguments: Optional[Dict[str, Any]] = None)
     return await task_prompts.performance_review_prompt(arguments)
 
 
-def get_prompt_definitions() -> List[Dict[str, Any]]:
-    """Get all prompt definitions"""
-    return [
+@functools.lru_cache(maxsize=1)
+def _prompt_definitions_json() -> bytes:
+    """All prompt definitions, serialized once"""
+    return orjson.dumps([
         {
             "name": "task_summary",
             "description": "Generate a summary of task execution and performance",
@@ -661,4 +694,13 @@ def get_prompt_definitions() -> List[Dict[str, Any]]:
                 }
             ]
         }
-    ]
\ No newline at end of file
+    ])
+
+
+def get_prompt_definitions() -> List[Dict[str, Any]]:
+    """Get all prompt definitions
+
+    Each call decodes the cached JSON, so callers get their own copy and
+    mutating it cannot leak into later calls.
+    """
+    return orjson.loads(_prompt_definitions_json())
@@ -0,0 +1,110 @@
+"""
+Resource result cache
+
+Short-lived in-process cache for DB-backed resources. Polling MCP clients
+read the same resources many times a second; a few seconds of staleness
+lets those reads share one query set, and concurrent misses wait on the
+single in-flight computation instead of each hitting the database. When
+the database fails, the last good value keeps being served.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, Type
+
+
+class AsyncTTLCache:
+    """TTL cache for coroutine results with single-flight misses
+
+    Errors listed in stale_on act as a simple circuit breaker: the last good
+    value is served for another ttl if there is one, otherwise the error is
+    remembered and re-raised for ttl seconds without calling the factory again.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._failures: Dict[Hashable, Tuple[float, BaseException]] = {}
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        stale_on: Tuple[Type[BaseException], ...] = ()
+    ) -> Any:
+        """Return the cached value for key, computing it at most once per expiry"""
+        if self.ttl <= 0:
+            return await factory()
+
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        failure = self._failures.get(key)
+        if failure is not None and failure[0] > now:
+            raise failure[1]
+
+        pending = self._inflight.get(key)
+        while pending is not None:
+            try:
+                # shield: a cancelled waiter must not cancel the shared computation
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only this waiter's own cancellation propagates; when the computing
+                # task was cancelled instead, retry and let one waiter take over
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            pending = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            try:
+                value = await factory()
+            except stale_on as exc:
+                if entry is None:
+                    self._failures[key] = (time.monotonic() + self.ttl, exc)
+                    raise
+                # Serve the last good value and hold off retrying for another ttl
+                value = entry[1]
+            else:
+                self._failures.pop(key, None)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                # Waiters see the cancelled future and retry rather than fail
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark retrieved so an unawaited failure doesn't log "never retrieved"
+                future.exception()
+            raise
+        else:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop every cached value and remembered failure"""
+        self._entries.clear()
+        self._failures.clear()
+
+
+def cached(ttl: float, stale_on: Tuple[Type[BaseException], ...] = ()) -> Callable:
+    """Cache an argument-free resource coroutine (or method) for ttl seconds"""
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache = AsyncTTLCache(ttl)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any) -> Any:
+            return await cache.get_or_compute(func.__qualname__, lambda: func(*args), stale_on)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
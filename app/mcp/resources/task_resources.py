@@ -5,17 +5,141 @@ Resource handlers for providing structured data about tasks,
 schemas, and system information through Model Context Protocol.
 """
 
-import json
+import asyncio
+import functools
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+import operator
+import time
+from dataclasses import asdict
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple
+
+import orjson
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.database import get_db_session
 from app.crud import task as task_crud
-from app.mcp.config import MCPResourceDefinitions, mcp_settings
+from app.mcp.config import AVAILABLE_MODELS, TASK_SCHEMA, TASK_STATUSES, mcp_settings
+from app.mcp.resources._cache import cached
 
 logger = logging.getLogger(__name__)
 
+# Database failures the resources degrade around (stale or partial data) instead of erroring
+_DB_ERRORS = (SQLAlchemyError, asyncio.TimeoutError)
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a resource payload as indented JSON using orjson"""
+    # Status breakdowns are keyed by TaskStatus members, which orjson treats as non-str keys
+    return orjson.dumps(
+        data,
+        default=_read_only_mapping,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _read_only_mapping(obj: Any) -> Dict[str, Any]:
+    """Let orjson serialize the read-only resource definitions"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError
+
+
+# (epoch second, ISO-8601 UTC string) of the last timestamp handed out
+_now_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, formatted at most once per second"""
+    global _now_iso_cache
+    second = int(time.time())
+    if _now_iso_cache[0] != second:
+        _now_iso_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second)))
+    return _now_iso_cache[1]
+
+
+@functools.lru_cache(maxsize=1)
+def _task_schema_json(max_prompt_length: int, max_priority: int) -> str:
+    """Serialize the task schema resource once per prompt-length/priority limits"""
+    schema = dict(TASK_SCHEMA)
+
+    # Add usage examples
+    schema["examples"] = [
+        {
+            "id": 1,
+            "prompt": "Explain quantum computing in simple terms",
+            "model": "deepseek-chat",
+            "provider": "deepseek",
+            "status": "COMPLETED",
+            "priority": 5,
+            "result": "Quantum computing is a revolutionary approach...",
+            "created_at": "2025-11-27T03:00:00Z",
+            "updated_at": "2025-11-27T03:02:00Z"
+        },
+        {
+            "id": 2,
+            "prompt": "Write a Python function to calculate factorial",
+            "model": "gpt-4",
+            "provider": "openai",
+            "status": "PROCESSING",
+            "priority": 8,
+            "created_at": "2025-11-27T03:05:00Z",
+            "updated_at": "2025-11-27T03:05:00Z"
+        }
+    ]
+
+    # Add validation rules
+    schema["validation_rules"] = {
+        "prompt": {
+            "required": True,
+            "min_length": 1,
+            "max_length": max_prompt_length,
+            "pattern": ".*\\S+.*"  # At least one non-whitespace character
+        },
+        "status": {
+            "required": True,
+            "enum": list(TASK_STATUSES.keys())
+        },
+        "priority": {
+            "required": True,
+            "minimum": 1,
+            "maximum": max_priority
+        }
+    }
+
+    return _dumps(schema)
+
+
+# Token counts used for the per-model cost estimates
+_COST_ESTIMATE_SIZES = (("short_task", 100), ("medium_task", 1000), ("long_task", 5000))
+
+
+def _build_static_models() -> Dict[str, Dict[str, Any]]:
+    """Model descriptions with cost estimates; none of this depends on the database"""
+    models = {}
+    for key, info in AVAILABLE_MODELS.items():
+        model = asdict(info)
+        model["cost_estimates"] = {
+            size: {"tokens": tokens, "estimated_cost": info.cost_per_token * tokens}
+            for size, tokens in _COST_ESTIMATE_SIZES
+        }
+        models[key] = model
+    return models
+
+
+_MODELS_STATIC = _build_static_models()
+
+# Usage stats are reported per model name; the first model with a name wins, as the old scan did
+_MODEL_NAME_TO_KEY: Dict[str, str] = {}
+for _key, _info in AVAILABLE_MODELS.items():
+    _MODEL_NAME_TO_KEY.setdefault(_info.name, _key)
+
+_MODEL_COMPARISON = {
+    "cheapest": min(AVAILABLE_MODELS.values(), key=operator.attrgetter("cost_per_token")).name,
+    "largest_context": max(AVAILABLE_MODELS.values(), key=operator.attrgetter("context_window")).name,
+    "most_recommended": "deepseek-chat"  # Our default recommendation
+}
+
 
 class TaskResourcesMixin:
     """Mixin class providing task-related resources"""
@@ -28,60 +152,14 @@ class TaskResourcesMixin:
             JSON string containing task schema
         """
         try:
-            schema = MCPResourceDefinitions.TASK_SCHEMA.copy()
-
-            # Add usage examples
-            schema["examples"] = [
-                {
-                    "id": 1,
-                    "prompt": "Explain quantum computing in simple terms",
-                    "model": "deepseek-chat",
-                    "provider": "deepseek",
-                    "status": "COMPLETED",
-                    "priority": 5,
-                    "result": "Quantum computing is a revolutionary approach...",
-                    "created_at": "2025-11-27T03:00:00Z",
-                    "updated_at": "2025-11-27T03:02:00Z"
-                },
-                {
-                    "id": 2,
-                    "prompt": "Write a Python function to calculate factorial",
-                    "model": "gpt-4",
-                    "provider": "openai",
-                    "status": "PROCESSING",
-                    "priority": 8,
-                    "created_at": "2025-11-27T03:05:00Z",
-                    "updated_at": "2025-11-27T03:05:00Z"
-                }
-            ]
-
-            # Add validation rules
-            schema["validation_rules"] = {
-                "prompt": {
-                    "required": True,
-                    "min_length": 1,
-                    "max_length": mcp_settings.max_task_prompt_length,
-                    "pattern": ".*\\S+.*"  # At least one non-whitespace character
-                },
-                "status": {
-                    "required": True,
-                    "enum": list(MCPResourceDefinitions.TASK_STATUSES.keys())
-                },
-                "priority": {
-                    "required": True,
-                    "minimum": 1,
-                    "maximum": mcp_settings.max_priority
-                }
-            }
-
-            return json.dumps(schema, indent=2)
+            return _task_schema_json(mcp_settings.max_task_prompt_length, mcp_settings.max_priority)
 
         except Exception as e:
             logger.error(f"Error generating task schema resource: {e}")
-            return json.dumps({
+            return _dumps({
                 "error": str(e),
                 "message": "Failed to generate task schema"
-            }, indent=2)
+            })
 
     async def task_statuses_resource(self) -> str:
         """
@@ -91,59 +169,70 @@ class TaskResourcesMixin:
             JSON string containing status definitions
         """
         try:
-            # Get real-time status counts from database
-            async with get_db_session() as db:
-                status_counts = {}
-                try:
-                    # Get count by status
-                    tasks_by_status = await task_crud.get_task_counts_by_status(db)
-                    for task_info in tasks_by_status:
-                        status_counts[task_info.status] = task_info.count
-                except Exception as db_error:
-                    logger.warning(f"Could not get status counts from DB: {db_error}")
-                    status_counts = {}
-
-            # Build status information
-            status_info = MCPResourceDefinitions.TASK_STATUSES.copy()
-            for status, info in status_info.items():
-                info["count"] = status_counts.get(status, 0)
-                info["description"] += f" (Current count: {status_counts.get(status, 0)})"
-
-            # Add workflow information
-            workflow = [
-                {
-                    "from_status": "PENDING",
-                    "to_status": "PROCESSING",
-                    "trigger": "AI worker picks up task",
-                    "automatic": True
-                },
-                {
-                    "from_status": "PROCESSING",
-                    "to_status": "COMPLETED",
-                    "trigger": "AI processing successful",
-                    "automatic": True
-                },
-                {
-                    "from_status": "PROCESSING",
-                    "to_status": "FAILED",
-                    "trigger": "AI processing error or timeout",
-                    "automatic": True
-                }
-            ]
+            return await self._task_statuses_json()
 
-            return json.dumps({
-                "statuses": status_info,
-                "workflow": workflow,
-                "total_tasks": sum(status_counts.values()),
-                "last_updated": datetime.utcnow().isoformat() + "Z"
-            }, indent=2)
+        except _DB_ERRORS as db_error:
+            # Degraded document without counts; built per call, never cached
+            logger.warning(f"Could not get status counts from DB: {db_error}")
+            return self._render_task_statuses({})
 
         except Exception as e:
             logger.error(f"Error generating task statuses resource: {e}")
-            return json.dumps({
+            return _dumps({
                 "error": str(e),
                 "message": "Failed to generate task status information"
-            }, indent=2)
+            })
+
+    @cached(ttl=mcp_settings.resource_cache_ttl, stale_on=_DB_ERRORS)
+    async def _task_statuses_json(self) -> str:
+        """Build the task statuses document (database errors propagate so the cache can serve stale data)"""
+        async with get_db_session() as db:
+            tasks_by_status = await task_crud.get_task_counts_by_status(db)
+        return self._render_task_statuses(
+            {task_info["status"]: task_info["count"] for task_info in tasks_by_status}
+        )
+
+    @staticmethod
+    def _render_task_statuses(status_counts: Dict[str, int]) -> str:
+        """Render the task statuses document for the given status counts"""
+        # Build status information
+        status_info = {
+            status: {
+                **asdict(info),
+                "count": status_counts.get(status, 0),
+                "description": f"{info.description} (Current count: {status_counts.get(status, 0)})"
+            }
+            for status, info in TASK_STATUSES.items()
+        }
+
+        # Add workflow information
+        workflow = [
+            {
+                "from_status": "PENDING",
+                "to_status": "PROCESSING",
+                "trigger": "AI worker picks up task",
+                "automatic": True
+            },
+            {
+                "from_status": "PROCESSING",
+                "to_status": "COMPLETED",
+                "trigger": "AI processing successful",
+                "automatic": True
+            },
+            {
+                "from_status": "PROCESSING",
+                "to_status": "FAILED",
+                "trigger": "AI processing error or timeout",
+                "automatic": True
+            }
+        ]
+
+        return _dumps({
+            "statuses": status_info,
+            "workflow": workflow,
+            "total_tasks": sum(status_counts.values()),
+            "last_updated": _now_iso()
+        })
 
     async def available_models_resource(self) -> str:
         """
@@ -153,68 +242,54 @@ class TaskResourcesMixin:
             JSON string containing model definitions and availability
         """
         try:
-            models = MCPResourceDefinitions.AVAILABLE_MODELS.copy()
-
-            # Add current usage statistics
-            async with get_db_session() as db:
-                try:
-                    # Get model usage counts
-                    model_usage = await task_crud.get_model_usage_stats(db)
-                    for model_name, usage_info in model_usage.items():
-                        # Add usage stats to model info
-                        for model_key, model_info in models.items():
-                            if model_info["name"] == model_name:
-                                model_info["usage_stats"] = {
-                                    "total_tasks": usage_info.total_tasks,
-                                    "completed_tasks": usage_info.completed_tasks,
-                                    "success_rate": (
-                                        usage_info.completed_tasks / usage_info.total_tasks * 100
-                                        if usage_info.total_tasks > 0
-                                        else 0
-                                    )
-                                }
-                                break
-                except Exception as db_error:
-                    logger.warning(f"Could not get model usage stats: {db_error}")
-
-            # Add cost estimation for common task sizes
-            for model_key, model_info in models.items():
-                model_info["cost_estimates"] = {
-                    "short_task": {
-                        "tokens": 100,
-                        "estimated_cost": model_info["cost_per_token"] * 100
-                    },
-                    "medium_task": {
-                        "tokens": 1000,
-                        "estimated_cost": model_info["cost_per_token"] * 1000
-                    },
-                    "long_task": {
-                        "tokens": 5000,
-                        "estimated_cost": model_info["cost_per_token"] * 5000
-                    }
-                }
+            return await self._available_models_json()
 
-            # Add model comparison
-            comparison = {
-                "cheapest": min(models.items(), key=lambda x: x[1]["cost_per_token"])[1]["name"],
-                "largest_context": max(models.items(), key=lambda x: x[1]["context_window"])[1]["name"],
-                "most_recommended": "deepseek-chat"  # Our default recommendation
-            }
-
-            return json.dumps({
-                "models": models,
-                "comparison": comparison,
-                "default_model": mcp_settings.default_model,
-                "default_provider": mcp_settings.default_provider,
-                "last_updated": datetime.utcnow().isoformat() + "Z"
-            }, indent=2)
+        except _DB_ERRORS as db_error:
+            # Degraded document without usage stats; built per call, never cached
+            logger.warning(f"Could not get model usage stats: {db_error}")
+            return self._render_available_models({})
 
         except Exception as e:
             logger.error(f"Error generating available models resource: {e}")
-            return json.dumps({
+            return _dumps({
                 "error": str(e),
                 "message": "Failed to generate model information"
-            }, indent=2)
+            })
+
+    @cached(ttl=mcp_settings.resource_cache_ttl, stale_on=_DB_ERRORS)
+    async def _available_models_json(self) -> str:
+        """Build the available models document (database errors propagate so the cache can serve stale data)"""
+        async with get_db_session() as db:
+            model_usage = await task_crud.get_model_usage_stats(db)
+        return self._render_available_models(model_usage)
+
+    @staticmethod
+    def _render_available_models(model_usage: Dict[str, Any]) -> str:
+        """Render the available models document with the given usage stats merged in"""
+        # Copy each precomputed model entry so usage stats can be merged in
+        models = {key: dict(info) for key, info in _MODELS_STATIC.items()}
+
+        # Add current usage statistics
+        for model_name, usage_info in model_usage.items():
+            model_key = _MODEL_NAME_TO_KEY.get(model_name)
+            if model_key is not None:
+                models[model_key]["usage_stats"] = {
+                    "total_tasks": usage_info.total_tasks,
+                    "completed_tasks": usage_info.completed_tasks,
+                    "success_rate": (
+                        usage_info.completed_tasks / usage_info.total_tasks * 100
+                        if usage_info.total_tasks > 0
+                        else 0
+                    )
+                }
+
+        return _dumps({
+            "models": models,
+            "comparison": _MODEL_COMPARISON,
+            "default_model": mcp_settings.default_model,
+            "default_provider": mcp_settings.default_provider,
+            "last_updated": _now_iso()
+        })
 
     async def system_stats_resource(self) -> str:
         """
@@ -224,92 +299,79 @@ class TaskResourcesMixin:
             JSON string containing system statistics
         """
         try:
-            async with get_db_session() as db:
-                # Get overall statistics
-                total_tasks = await task_crud.get_total_task_count(db)
-
-                # Get status breakdown
-                status_breakdown = {}
-                try:
-                    status_counts = await task_crud.get_task_counts_by_status(db)
-                    for status_info in status_counts:
-                        status_breakdown[status_info.status] = status_info.count
-                except:
-                    status_breakdown = {"error": "Could not retrieve status breakdown"}
-
-                # Get recent activity (last 24 hours)
-                recent_activity = {}
-                try:
-                    recent_tasks = await task_crud.get_recent_tasks(db, hours=24)
-                    recent_activity = {
-                        "tasks_last_24h": len(recent_tasks),
-                        "completed_last_24h": len([t for t in recent_tasks if t.status == "COMPLETED"]),
-                        "failed_last_24h": len([t for t in recent_tasks if t.status == "FAILED"])
-                    }
-                except:
-                    recent_activity = {"error": "Could not retrieve recent activity"}
-
-                # Calculate performance metrics
-                performance_metrics = {}
-                try:
-                    avg_processing_time = await task_crud.get_average_processing_time(db)
-                    success_rate = (
-                        status_breakdown.get("COMPLETED", 0) / total_tasks * 100
-                        if total_tasks > 0
-                        else 0
-                    )
-
-                    performance_metrics = {
-                        "average_processing_time_seconds": avg_processing_time,
-                        "success_rate_percent": round(success_rate, 2),
-                        "total_completed": status_breakdown.get("COMPLETED", 0),
-                        "total_failed": status_breakdown.get("FAILED", 0)
-                    }
-                except:
-                    performance_metrics = {"error": "Could not calculate performance metrics"}
-
-            # System health indicators
-            system_health = {
-                "status": "healthy",
-                "issues": [],
-                "recommendations": []
-            }
-
-            # Check for potential issues
-            if recent_activity.get("tasks_last_24h", 0) == 0:
-                system_health["status"] = "warning"
-                system_health["issues"].append("No tasks in the last 24 hours")
-                system_health["recommendations"].append("Check if task creation is working properly")
-
-            if performance_metrics.get("success_rate_percent", 0) < 80:
-                system_health["status"] = "warning"
-                system_health["issues"].append("Low success rate detected")
-                system_health["recommendations"].append("Review AI model configurations and prompts")
-
-            return json.dumps({
-                "overview": {
-                    "total_tasks": total_tasks,
-                    "system_status": system_health["status"],
-                    "generated_at": datetime.utcnow().isoformat() + "Z"
-                },
-                "status_breakdown": status_breakdown,
-                "recent_activity": recent_activity,
-                "performance_metrics": performance_metrics,
-                "system_health": system_health,
-                "configuration": {
-                    "max_tasks_per_request": mcp_settings.max_tasks_per_request,
-                    "default_task_limit": mcp_settings.default_task_limit,
-                    "default_model": mcp_settings.default_model,
-                    "default_provider": mcp_settings.default_provider
-                }
-            }, indent=2)
+            return await self._system_stats_json()
 
         except Exception as e:
             logger.error(f"Error generating system stats resource: {e}")
-            return json.dumps({
+            return _dumps({
                 "error": str(e),
                 "message": "Failed to generate system statistics"
-            }, indent=2)
+            })
+
+    @cached(ttl=mcp_settings.resource_cache_ttl, stale_on=_DB_ERRORS)
+    async def _system_stats_json(self) -> str:
+        """Build the system stats document (database errors propagate so the cache can serve stale data)"""
+        async with get_db_session() as db:
+            stats = await task_crud.get_system_stats_bundle(db, hours=24)
+
+        total_tasks = stats.total
+        status_breakdown = stats.by_status
+
+        # Recent activity (last 24 hours)
+        recent_activity = {
+            "tasks_last_24h": stats.last24h_total,
+            "completed_last_24h": stats.last24h_completed,
+            "failed_last_24h": stats.last24h_failed
+        }
+
+        # Performance metrics
+        success_rate = (
+            status_breakdown.get("COMPLETED", 0) / total_tasks * 100
+            if total_tasks > 0
+            else 0
+        )
+        performance_metrics = {
+            "average_processing_time_seconds": stats.avg_processing_time,
+            "success_rate_percent": round(success_rate, 2),
+            "total_completed": status_breakdown.get("COMPLETED", 0),
+            "total_failed": status_breakdown.get("FAILED", 0)
+        }
+
+        # System health indicators
+        system_health = {
+            "status": "healthy",
+            "issues": [],
+            "recommendations": []
+        }
+
+        # Check for potential issues
+        if recent_activity.get("tasks_last_24h", 0) == 0:
+            system_health["status"] = "warning"
+            system_health["issues"].append("No tasks in the last 24 hours")
+            system_health["recommendations"].append("Check if task creation is working properly")
+
+        if performance_metrics.get("success_rate_percent", 0) < 80:
+            system_health["status"] = "warning"
+            system_health["issues"].append("Low success rate detected")
+            system_health["recommendations"].append("Review AI model configurations and prompts")
+
+        return _dumps({
+            "overview": {
+                "total_tasks": total_tasks,
+                "system_status": system_health["status"],
+                "generated_at": _now_iso()
+            },
+            "status_breakdown": status_breakdown,
+            "recent_activity": recent_activity,
+            "performance_metrics": performance_metrics,
+            "system_health": system_health,
+            "configuration": {
+                "max_tasks_per_request": mcp_settings.max_tasks_per_request,
+                "default_task_limit": mcp_settings.default_task_limit,
+                "default_model": mcp_settings.default_model,
+                "default_provider": mcp_settings.default_provider
+            }
+        })
 
 
 # Resource instance
@@ -336,9 +398,10 @@ async def system_stats_resource() -> str:
     return await task_resources.system_stats_resource()
 
 
-def get_resource_definitions() -> List[Dict[str, Any]]:
-    """Get all resource definitions"""
-    return [
+@functools.lru_cache(maxsize=1)
+def _resource_definitions_json() -> bytes:
+    """All resource definitions, serialized once"""
+    return orjson.dumps([
         {
             "uri": "data://tasks/schema",
             "name": "Task Schema",
@@ -363,4 +426,13 @@ def get_resource_definitions() -> List[Dict[str, Any]]:
             "description": "System performance metrics, health indicators, and configuration",
             "mime_type": "application/json"
         }
-    ]
\ No newline at end of file
+    ])
+
+
+def get_resource_definitions() -> List[Dict[str, Any]]:
+    """Get all resource definitions
+
+    Each call decodes the cached JSON, so callers get their own copy and
+    mutating it cannot leak into later calls.
+    """
+    return orjson.loads(_resource_definitions_json())
@@ -124,6 +124,11 @@ class AsyncAITaskRunnerMCPServer:
                                 "description": "跳过的任务数量",
                                 "minimum": 0,
                                 "default": 0
+                            },
+                            "before_id": {
+                                "type": "integer",
+                                "description": "只返回ID小于该值的任务（传入上一页的 next_before_id，代替递增的 offset）",
+                                "minimum": 1
                             }
                         },
                         "required": []
@@ -241,6 +246,7 @@ class AsyncAITaskRunnerMCPServer:
             )
 
             task = await task_crud.create_task(db=db, obj_in=task_in)
+            await db.commit()
 
             return CallToolResult(
                 content=[
@@ -333,14 +339,29 @@ class AsyncAITaskRunnerMCPServer:
         try:
             limit = arguments.get("limit", 10)
             offset = arguments.get("offset", 0)
+            before_id = arguments.get("before_id")
             status = arguments.get("status")
 
-            tasks = await task_crud.get_tasks_with_filters(
+            # Convert rows batch by batch so only one batch of ORM objects is alive at a time
+            tasks = []
+            async for batch in task_crud.iter_tasks(
                 db=db,
                 skip=offset,
                 limit=limit,
-                status=status
-            )
+                status=status,
+                before_id=before_id
+            ):
+                tasks.extend(
+                    {
+                        "id": task.id,
+                        "prompt": task.prompt[:100] + "..." if len(task.prompt) > 100 else task.prompt,
+                        "status": task.status,
+                        "model": task.model,
+                        "provider": task.provider,
+                        "priority": task.priority,
+                        "created_at": task.created_at.isoformat() if task.created_at else None
+                    } for task in batch
+                )
 
             return CallToolResult(
                 content=[
@@ -348,20 +369,11 @@ class AsyncAITaskRunnerMCPServer:
                         type="text",
                         text=json.dumps({
                             "success": True,
-                            "tasks": [
-                                {
-                                    "id": task.id,
-                                    "prompt": task.prompt[:100] + "..." if len(task.prompt) > 100 else task.prompt,
-                                    "status": task.status,
-                                    "model": task.model,
-                                    "provider": task.provider,
-                                    "priority": task.priority,
-                                    "created_at": task.created_at.isoformat() if task.created_at else None
-                                } for task in tasks
-                            ],
+                            "tasks": tasks,
                             "count": len(tasks),
                             "limit": limit,
-                            "offset": offset
+                            "offset": offset,
+                            "next_before_id": tasks[-1]["id"] if len(tasks) == limit else None
                         }, indent=2)
                     )
                 ]
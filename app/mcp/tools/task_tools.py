@@ -13,7 +13,7 @@ from mcp.types import TextContent
 from app.database import get_db_session
 from app.crud import task as task_crud
 from app.schemas import TaskCreate
-from app.mcp.config import validate_task_params, mcp_settings
+from app.mcp.config import get_sorted_allowed_values, validate_task_params, mcp_settings
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,7 @@ class TaskToolsMixin:
 
                 # Create task in database
                 task = await task_crud.create_task(db=db, obj_in=task_in)
+                await db.commit()
 
                 logger.info(f"Created task {task.id} via MCP: {task.prompt[:50]}...")
 
@@ -167,6 +168,7 @@ class TaskToolsMixin:
                 mcp_settings.max_tasks_per_request
             )
             offset = max(arguments.get("offset", 0), 0)
+            before_id = arguments.get("before_id")
             status = arguments.get("status")
 
             if status and status not in ["PENDING", "PROCESSING", "COMPLETED", "FAILED"]:
@@ -177,16 +179,16 @@ class TaskToolsMixin:
                 }
 
             async with get_db_session() as db:
-                tasks = await task_crud.get_tasks(
+                # Convert rows batch by batch so only one batch of ORM objects is alive at a time
+                tasks = []
+                async for batch in task_crud.iter_tasks(
                     db=db,
                     skip=offset,
                     limit=limit,
-                    status=status
-                )
-
-                return {
-                    "success": True,
-                    "tasks": [
+                    status=status,
+                    before_id=before_id
+                ):
+                    tasks.extend(
                         {
                             "id": task.id,
                             "prompt": (
@@ -202,11 +204,16 @@ class TaskToolsMixin:
                             "updated_at": task.updated_at.isoformat() if task.updated_at else None,
                             "has_result": bool(task.result) if task.status == "COMPLETED" else False
                         }
-                        for task in tasks
-                    ],
+                        for task in batch
+                    )
+
+                return {
+                    "success": True,
+                    "tasks": tasks,
                     "count": len(tasks),
                     "limit": limit,
                     "offset": offset,
+                    "next_before_id": tasks[-1]["id"] if len(tasks) == limit else None,
                     "status_filter": status
                 }
 
@@ -312,6 +319,7 @@ async def get_task_result_tool(arguments: Dict[str, Any]) -> Dict[str, Any]:
 
 def get_tool_schemas() -> List[Dict[str, Any]]:
     """Get schemas for all task tools"""
+    allowed_models, allowed_providers = get_sorted_allowed_values()
     return [
         {
             "name": "create_task",
@@ -326,13 +334,13 @@ def get_tool_schemas() -> List[Dict[str, Any]]:
                     "model": {
                         "type": "string",
                         "description": "AI model to use",
-                        "enum": mcp_settings.allowed_models,
+                        "enum": list(allowed_models),
                         "default": mcp_settings.default_model
                     },
                     "provider": {
                         "type": "string",
                         "description": "AI provider to use",
-                        "enum": mcp_settings.allowed_providers,
+                        "enum": list(allowed_providers),
                         "default": mcp_settings.default_provider
                     },
                     "priority": {
@@ -384,6 +392,11 @@ def get_tool_schemas() -> List[Dict[str, Any]]:
                         "description": "Number of tasks to skip",
                         "minimum": 0,
                         "default": 0
+                    },
+                    "before_id": {
+                        "type": "integer",
+                        "description": "Only return tasks older than this task ID; pass next_before_id from the previous page instead of a growing offset",
+                        "minimum": 1
                     }
                 },
                 "required": []
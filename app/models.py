@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index, DDL, event
 from sqlalchemy.sql import func
 from app.database import Base
 from app.schemas import TaskStatus
@@ -18,5 +18,37 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # Recent-task listings filter and sort on created_at
+        Index("ix_tasks_created_at", created_at.desc()),
+        # Status counts and status filters
+        Index("ix_tasks_status", status),
+        # Status-filtered listings, newest first
+        Index("ix_tasks_status_created_at", status, created_at.desc()),
+        # Processing-time stats only look at completed tasks
+        Index(
+            "ix_tasks_completed_updated_at",
+            updated_at,
+            postgresql_where=status == TaskStatus.COMPLETED,
+            sqlite_where=status == TaskStatus.COMPLETED,
+        ),
+    )
+
     def __repr__(self):
-        return f"<Task(id={self.id}, status={self.status}, model={self.model})>"
\ No newline at end of file
+        return f"<Task(id={self.id}, status={self.status}, model={self.model})>"
+
+
+class TaskDataVersion(Base):
+    """Single-row counter bumped in the same transaction as every task write"""
+    __tablename__ = "task_data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# The counter row exists as soon as the table does, so writers only ever UPDATE it
+event.listen(
+    TaskDataVersion.__table__,
+    "after_create",
+    DDL("INSERT INTO task_data_version (id, version) VALUES (1, 0)")
+)
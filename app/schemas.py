@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -33,6 +33,13 @@ class TaskUpdate(BaseModel):
 
 class TaskResponse(TaskBase):
     """Schema for task response"""
+    model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=False,
+        extra='ignore',
+        arbitrary_types_allowed=False
+    )
+
     id: int
     status: TaskStatus
     result: Optional[str] = None
@@ -48,13 +55,18 @@ class TaskResponse(TaskBase):
         local_time = value.astimezone()
         return local_time.strftime("%Y-%m-%d %H:%M:%S")
 
-    class Config:
-        from_attributes = True
-
 
 class HealthResponse(BaseModel):
     """Schema for health check response"""
     status: str
     app_name: str
     version: str
-    timestamp: datetime
\ No newline at end of file
+    timestamp: datetime
+
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def convert_epoch_ns(cls, value):
+        """将纳秒级 epoch 整数转换为 UTC datetime"""
+        if isinstance(value, int):
+            return datetime.fromtimestamp(value / 1e9, tz=timezone.utc)
+        return value
\ No newline at end of file
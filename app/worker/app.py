@@ -2,8 +2,14 @@
 Celery应用配置
 负责创建和配置Celery实例，作为异步任务处理的中央调度器
 """
+import importlib
+import logging
 from celery import Celery
-from app.core.config_fixed import settings
+from celery.signals import worker_init, worker_process_init
+from kombu import Queue
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 # 创建Celery实例
 celery_app = Celery(
@@ -31,10 +37,15 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
 
-    # 任务路由配置
+    # 任务路由配置（任务注册时使用了显式 name，因此按任务名匹配）
+    # 耗时的 AI 推理任务走独立队列，由专门的 worker 消费，避免预取时阻塞短任务
+    task_queues=(
+        Queue(settings.celery_ai_queue),
+        Queue(settings.celery_short_queue),
+    ),
+    task_default_queue=settings.celery_short_queue,
     task_routes={
-        "app.worker.tasks.ai_tasks.*": {"queue": "ai_processing"},
-        "app.worker.tasks.demo_tasks.*": {"queue": "demo_tasks"},
+        "run_ai_*": {"queue": settings.celery_ai_queue},
     },
 
     # 任务优先级
@@ -54,6 +65,64 @@ celery_app.conf.update(
     task_send_sent_event=True,
 )
 
+
+
+@worker_process_init.connect
+def reset_db_pool_after_fork(**kwargs):
+    """
+    子进程 fork 后丢弃从父进程继承的连接池
+
+    close=False 只放弃引用而不关闭父进程仍在使用的连接，
+    避免多个进程共享同一个数据库连接的文件描述符
+    """
+    from app.database import sync_engine
+
+    sync_engine.dispose(close=False)
+
+
+@worker_init.connect
+def reject_in_memory_database(**kwargs):
+    """
+    拒绝在内存 SQLite 数据库上启动 worker
+
+    内存数据库只存在于创建它的进程中，worker 进程看不到 API 写入的任务，
+    启动后只会不断处理不存在的任务。这里用 SystemExit 退出（普通异常会被信号分发吞掉并仅记录日志）。
+    """
+    from app.database import database_url, is_in_memory_database
+
+    if is_in_memory_database(database_url):
+        logger.critical(
+            "❌ DATABASE_URL 指向内存 SQLite 数据库，Celery worker 无法与 API 进程共享，"
+            "请改用 SQLite 文件或 PostgreSQL"
+        )
+        raise SystemExit(1)
+
+
+@worker_init.connect
+def make_psycopg_cooperative(sender=None, **kwargs):
+    """
+    gevent/eventlet 协程池下让 psycopg2 的数据库等待让出协程
+
+    monkey patch 无法覆盖 psycopg2 的 C 扩展，同步会话的每次读写都会阻塞整个 worker；
+    psycogreen 为其注册等待回调。prefork 池无需处理。
+    """
+    pool_module = getattr(sender.pool_cls, "__module__", str(sender.pool_cls))
+    if "gevent" in pool_module:
+        green_module = "psycogreen.gevent"
+    elif "eventlet" in pool_module:
+        green_module = "psycogreen.eventlet"
+    else:
+        return
+
+    try:
+        patch_psycopg = importlib.import_module(green_module).patch_psycopg
+    except ImportError:
+        logger.warning("⚠️ 未安装 psycogreen，协程池中的数据库调用将阻塞 worker（安装 gevent 可选依赖）")
+        return
+    patch_psycopg()
+    logger.info("🟢 已为 psycopg2 启用协程友好的等待回调 (%s)", green_module)
+
+
 print(f"🚀 Celery应用已初始化")
 print(f"📡 Broker: {settings.celery_broker_url}")
 print(f"💾 Backend: {settings.celery_result_backend}")
\ No newline at end of file
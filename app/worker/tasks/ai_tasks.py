@@ -3,12 +3,15 @@ AI相关的Celery任务
 处理实际的AI文本生成、图像处理等耗时操作
 """
 import asyncio
+import logging
 import time
 from datetime import datetime
 from app.worker.app import celery_app
 from app.models import TaskStatus
 from app.services.ai_service import ai_service
 
+logger = logging.getLogger(__name__)
+
 
 @celery_app.task(bind=True, name="run_ai_text_generation")
 def run_ai_text_generation(self, task_id: str, prompt: str, model: str = None,
@@ -20,10 +23,11 @@ def run_ai_text_generation(self, task_id: str, prompt: str, model: str = None,
     start_time = time.time()
 
     try:
-        print(f"🤖 开始处理AI文本生成任务: {task_id}")
-        print(f"📝 Prompt: {prompt}")
-        print(f"🧠 Model: {model or 'default'}")
-        print(f"🔌 Provider: {provider or 'default'}")
+        logger.info(
+            "🤖 开始处理AI文本生成任务: %s (model=%s, provider=%s)",
+            task_id, model or "default", provider or "default"
+        )
+        logger.debug("📝 Prompt: %s", prompt)
 
         # 导入CRUD函数（避免循环导入）
         from app.crud.task import update_task_status, update_task_result
@@ -34,13 +38,13 @@ def run_ai_text_generation(self, task_id: str, prompt: str, model: str = None,
         # 检查AI服务是否可用
         if not ai_service.is_available():
             error_msg = "❌ 没有可用的AI服务，请配置API密钥"
-            print(error_msg)
+            logger.error(error_msg)
             update_task_result(task_id, TaskStatus.FAILED, error_msg)
             raise Exception(error_msg)
 
         # 显示可用的AI提供商
         available_providers = ai_service.list_available_providers()
-        print(f"🔧 可用AI提供商: {available_providers}")
+        logger.debug("🔧 可用AI提供商: %s", available_providers)
 
         # 使用真实AI服务生成文本
         try:
@@ -61,23 +65,23 @@ def run_ai_text_generation(self, task_id: str, prompt: str, model: str = None,
             raise Exception(f"异步AI服务调用失败: {str(async_error)}")
 
             processing_time = time.time() - start_time
-            print(f"⏱️ AI处理时间: {processing_time:.2f}秒")
+            logger.info("⏱️ AI处理时间: %.2f秒", processing_time)
 
         except Exception as ai_error:
             error_msg = f"AI服务调用失败: {str(ai_error)}"
-            print(f"❌ {error_msg}")
+            logger.warning("❌ %s", error_msg)
 
             # 如果AI服务失败，尝试使用模拟结果作为备选
-            print("🔄 使用模拟AI结果作为备选方案...")
+            logger.info("🔄 使用模拟AI结果作为备选方案...")
             result = _generate_fallback_result(prompt)
             processing_time = time.time() - start_time
 
         # 更新任务结果
         update_task_result(task_id, TaskStatus.COMPLETED, result)
 
-        print(f"✅ AI文本生成任务完成: {task_id}")
-        print(f"📄 生成结果长度: {len(result)} 字符")
-        print(f"📄 生成结果预览: {result[:100]}...")
+        logger.info("✅ AI文本生成任务完成: %s (结果长度 %d 字符)", task_id, len(result))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📄 生成结果预览: %s...", result[:100])
 
         return {
             'task_id': task_id,
@@ -90,8 +94,7 @@ def run_ai_text_generation(self, task_id: str, prompt: str, model: str = None,
     except Exception as e:
         processing_time = time.time() - start_time
         error_msg = f"AI文本生成失败: {str(e)}"
-        print(f"❌ {error_msg}")
-        print(f"⏱️ 失败前耗时: {processing_time:.2f}秒")
+        logger.error("❌ %s (失败前耗时 %.2f秒)", error_msg, processing_time)
 
         # 更新任务状态为失败
         update_task_result(task_id, TaskStatus.FAILED, error_msg)
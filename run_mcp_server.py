@@ -8,7 +8,6 @@ This script provides a command-line interface for running the MCP server.
 
 import asyncio
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
@@ -17,7 +16,7 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from app.mcp.config import mcp_settings, get_mcp_config
+from app.mcp.config import mcp_settings, get_mcp_config, get_mcp_config_json
 from app.mcp.server import mcp_server
 
 # Configure logging
@@ -310,7 +309,7 @@ Examples:
 
     if args.print_config:
         print("⚙️  Server Configuration:")
-        print(json.dumps(get_mcp_config(), indent=2))
+        print(get_mcp_config_json().decode())
         sys.exit(0)
 
     if args.print_connection:
@@ -15,12 +15,12 @@ def test_direct_imports():
     print("🔍 Testing direct imports...")
 
     try:
-        # Test config_fixed.py directly
-        import app.core.config_fixed as config_module
-        print("✅ config_fixed.py imported successfully")
+        # Test config.py directly
+        import app.core.config as config_module
+        print("✅ config.py imported successfully")
 
         # Create settings instance
-        settings = config_module.Settings()
+        settings = config_module.get_settings()
         print(f"✅ Settings created: {settings.app_name}")
         return True
     except Exception as e:
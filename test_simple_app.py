@@ -16,7 +16,7 @@ async def test_app_imports():
 
     try:
         from app.main import app
-        from app.core.config_simple import settings
+        from app.core.config import settings
         print("✅ App imports successful!")
         print(f"✅ App title: {app.title}")
         return True
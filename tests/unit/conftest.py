@@ -0,0 +1,10 @@
+"""
+Pytest configuration for the self-contained unit tests.
+"""
+
+
+def pytest_configure(config):
+    """Register the custom markers used by the unit tests."""
+    config.addinivalue_line(
+        "markers", "unit: Mark test as unit test"
+    )
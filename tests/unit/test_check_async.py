@@ -0,0 +1,167 @@
+# 🛡️ Async Checker Unit Tests
+"""
+Unit tests for the backend-guard check_async.py script.
+"""
+
+import importlib.util
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parents[2]
+    / ".claude" / "skills" / "backend-guard" / "scripts" / "check_async.py"
+)
+
+
+@pytest.fixture
+def check_async(tmp_path, monkeypatch):
+    """Load check_async.py with its AST cache and check index under tmp_path."""
+    spec = importlib.util.spec_from_file_location("check_async", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered under its own name so the process pool can pickle its functions
+    monkeypatch.syspath_prepend(str(SCRIPT_PATH.parent))
+    monkeypatch.setitem(sys.modules, "check_async", module)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "AST_CACHE_DIR", tmp_path / "cache" / "ast")
+    monkeypatch.setattr(module, "CHECK_INDEX_PATH", tmp_path / "cache" / "index.json")
+    return module
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """A directory with one blocking async module and one plain module."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "blocking.py").write_text("import time\n\nasync def handler():\n    time.sleep(1)\n")
+    (src / "plain.py").write_text("VALUE = 1\n")
+    return src
+
+
+class TestIncrementalCheck:
+    """Test the stat-based check index."""
+
+    @pytest.mark.unit
+    def test_unchanged_files_are_skipped(self, check_async, source_dir):
+        """Test that a second run reuses the indexed results."""
+        files = sorted(str(path) for path in source_dir.iterdir())
+        first, skipped_first = check_async.check_files_incremental(files)
+        second, skipped_second = check_async.check_files_incremental(files)
+
+        assert skipped_first == 0
+        assert skipped_second == len(files)
+        assert second == first
+
+    @pytest.mark.unit
+    def test_vanished_file_is_skipped(self, check_async, source_dir):
+        """Test that a listed file deleted before it is checked is left out instead of crashing."""
+        files = [str(source_dir / "blocking.py"), str(source_dir / "gone.py")]
+
+        results, _ = check_async.check_files_incremental(files)
+
+        assert [filepath for filepath, _ in results] == [str(source_dir / "blocking.py")]
+
+    @pytest.mark.unit
+    def test_deleted_files_are_pruned_from_index(self, check_async, source_dir):
+        """Test that index entries for deleted files are dropped."""
+        plain = source_dir / "plain.py"
+        check_async.check_files_incremental(
+            [str(source_dir / "blocking.py"), str(plain)]
+        )
+        plain.unlink()
+
+        check_async.check_files_incremental([str(source_dir / "blocking.py")])
+
+        assert str(plain.resolve()) not in check_async.load_check_index()
+        assert str((source_dir / "blocking.py").resolve()) in check_async.load_check_index()
+
+
+def _issues(check_async, tmp_path, source):
+    """Run check_file on a fixture module and return the flagged line numbers."""
+    path = tmp_path / "fixture.py"
+    path.write_text(textwrap.dedent(source))
+    return [issue["line"] for issue in check_async.check_file(path)]
+
+
+class TestBlockingCallRules:
+    """Test which calls inside async functions are flagged."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("source", [
+        """
+        import time as t
+
+        async def handler():
+            t.sleep(1)
+        """,
+        """
+        from time import sleep
+
+        async def handler():
+            sleep(1)
+        """,
+        """
+        from time import sleep as pause
+
+        async def handler():
+            pause(1)
+        """,
+        """
+        import urllib.request
+
+        async def handler(url):
+            urllib.request.urlopen(url)
+        """,
+        """
+        from urllib.request import urlopen as fetch
+
+        async def handler(url):
+            fetch(url)
+        """,
+        """
+        import os
+
+        async def handler(directory):
+            open(os.path.join(directory, "data.txt"))
+        """,
+    ], ids=["alias-import", "from-import", "from-import-alias", "urllib", "urllib-from-alias", "open"])
+    def test_blocking_call_in_async_is_flagged(self, check_async, tmp_path, source):
+        """Test that blocking calls are flagged however they were imported."""
+        assert _issues(check_async, tmp_path, source) == [5]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("source", [
+        """
+        import time
+
+        def handler():
+            time.sleep(1)
+            open("data.txt")
+
+        async def other():
+            pass
+        """,
+        """
+        from asyncio import sleep
+
+        async def handler():
+            await sleep(1)
+        """,
+        """
+        import urllib.parse
+
+        async def handler(url):
+            urllib.parse.urlparse(url)
+        """,
+        """
+        from aiofiles import open
+
+        async def handler(path):
+            await open(path)
+        """,
+    ], ids=["sync-function", "asyncio-sleep", "urllib-parse", "aiofiles-open"])
+    def test_non_blocking_call_is_skipped(self, check_async, tmp_path, source):
+        """Test that sync functions and non-blocking look-alikes are not flagged."""
+        assert _issues(check_async, tmp_path, source) == []
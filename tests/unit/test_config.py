@@ -0,0 +1,47 @@
+# ⚙️ Settings Unit Tests
+"""
+Unit tests for application settings loading and derived configuration values.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings, get_settings
+
+
+class TestSettings:
+    """Test Settings construction and caching."""
+
+    @pytest.mark.unit
+    def test_get_settings_is_cached(self):
+        """Test that get_settings returns a single shared instance."""
+        assert get_settings() is get_settings()
+
+    @pytest.mark.unit
+    def test_settings_are_frozen(self):
+        """Test that settings cannot be mutated after construction."""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            settings.debug = True
+
+    @pytest.mark.unit
+    def test_cors_origins_split_at_construction(self):
+        """Test that CORS origins are parsed once from the comma-separated string."""
+        settings = Settings(cors_origins_str="http://a.example, http://b.example,,")
+
+        assert settings.cors_origins == ["http://a.example", "http://b.example"]
+
+    @pytest.mark.unit
+    def test_cors_origins_not_read_from_env(self, monkeypatch):
+        """Test that a CORS_ORIGINS env var does not override the derived list."""
+        monkeypatch.setenv("CORS_ORIGINS", "http://ignored.example")
+        settings = Settings(cors_origins_str="http://a.example")
+
+        assert settings.cors_origins == ["http://a.example"]
+
+    @pytest.mark.unit
+    def test_sqlite_rejected_in_production(self):
+        """Test that production settings refuse a SQLite database URL."""
+        with pytest.raises(ValidationError):
+            Settings(environment="production", database_url="sqlite+aiosqlite:///./app.db")
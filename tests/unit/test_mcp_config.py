@@ -0,0 +1,93 @@
+# 🔌 MCP Config Unit Tests
+"""
+Unit tests for the public MCP configuration helpers.
+"""
+
+import enum
+import json
+
+import orjson
+import pytest
+
+from app.mcp.config import get_mcp_config, get_mcp_config_json, validate_task_params
+
+
+class TestMCPConfig:
+    """Test MCP configuration serialization and isolation."""
+
+    @pytest.mark.unit
+    def test_public_config_is_json_serializable(self):
+        """Test that the public config serializes with the stdlib encoder."""
+        config = get_mcp_config()
+
+        assert json.loads(json.dumps(config)) == config
+        assert orjson.loads(get_mcp_config_json()) == config
+
+    @pytest.mark.unit
+    def test_public_config_mutation_does_not_leak(self):
+        """Test that mutating a returned config does not affect later calls."""
+        config = get_mcp_config()
+        config["server"]["name"] = "changed"
+        config["security"]["allowed_models"].append("other")
+
+        fresh = get_mcp_config()
+        assert fresh["server"]["name"] != "changed"
+        assert "other" not in fresh["security"]["allowed_models"]
+
+
+class TestValidateTaskParams:
+    """Test MCP task parameter validation."""
+
+    @pytest.mark.unit
+    def test_valid_params(self):
+        """Test that a prompt alone, or with allowed values, is accepted."""
+        assert validate_task_params({"prompt": "Hello"}) == (True, None)
+        assert validate_task_params(
+            {"prompt": "Hello", "model": "gpt-4", "provider": "openai", "priority": 5}
+        ) == (True, None)
+
+    @pytest.mark.unit
+    def test_missing_or_empty_prompt(self):
+        """Test that missing, non-string and blank prompts are rejected."""
+        assert validate_task_params({}) == (False, "Prompt is required")
+        for prompt in (None, 42, "", "   "):
+            valid, error = validate_task_params({"prompt": prompt})
+            assert not valid
+            assert error == "Prompt must be a non-empty string"
+
+    @pytest.mark.unit
+    def test_prompt_length_checked_before_blankness(self):
+        """Test that an over-long prompt reports the length limit, even when blank."""
+        for prompt in ("x" * 1001, " " * 1001):
+            valid, error = validate_task_params({"prompt": prompt})
+            assert not valid
+            assert error.startswith("Prompt too long")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("model", ["unknown-model", None, ["gpt-4"], {"name": "gpt-4"}])
+    def test_invalid_model(self, model):
+        """Test that unknown, non-string and unhashable models are rejected without raising."""
+        valid, error = validate_task_params({"prompt": "Hello", "model": model})
+
+        assert not valid
+        assert error.startswith("Model ")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("provider", ["unknown", 1, ["openai"], {"openai": True}])
+    def test_invalid_provider(self, provider):
+        """Test that unknown, non-string and unhashable providers are rejected without raising."""
+        valid, error = validate_task_params({"prompt": "Hello", "provider": provider})
+
+        assert not valid
+        assert error.startswith("Provider ")
+
+    @pytest.mark.unit
+    def test_priority(self):
+        """Test that int-like priorities are accepted and other values rejected."""
+        Level = enum.IntEnum("Level", {"HIGH": 9})
+
+        assert validate_task_params({"prompt": "Hello", "priority": Level.HIGH}) == (True, None)
+        for priority in (0, 11, 2.0, "5", [5]):
+            valid, error = validate_task_params({"prompt": "Hello", "priority": priority})
+            assert not valid
+            assert error.startswith("Priority must be between 1 and")
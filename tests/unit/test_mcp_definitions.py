@@ -0,0 +1,42 @@
+# 📋 MCP Definitions Unit Tests
+"""
+Unit tests for the cached MCP prompt and resource definitions.
+"""
+
+import pytest
+
+from app.mcp.prompts.task_prompts import get_prompt_definitions
+from app.mcp.resources.task_resources import get_resource_definitions
+
+
+class TestPromptDefinitions:
+    """Test that prompt definitions are cached but not shared."""
+
+    @pytest.mark.unit
+    def test_mutation_does_not_leak(self):
+        """Test that mutating returned definitions does not affect later calls."""
+        definitions = get_prompt_definitions()
+        definitions[0]["name"] = "changed"
+        definitions[0]["arguments"].clear()
+        definitions.append({"name": "extra"})
+
+        fresh = get_prompt_definitions()
+        assert fresh[0]["name"] == "task_summary"
+        assert fresh[0]["arguments"]
+        assert all(definition["name"] != "extra" for definition in fresh)
+
+
+class TestResourceDefinitions:
+    """Test that resource definitions are cached but not shared."""
+
+    @pytest.mark.unit
+    def test_mutation_does_not_leak(self):
+        """Test that mutating returned definitions does not affect later calls."""
+        definitions = get_resource_definitions()
+        uri = definitions[0]["uri"]
+        definitions[0]["uri"] = "data://changed"
+        definitions.clear()
+
+        fresh = get_resource_definitions()
+        assert fresh
+        assert fresh[0]["uri"] == uri
@@ -0,0 +1,34 @@
+# 💬 Prompt Cache Unit Tests
+"""
+Unit tests for the in-process MCP prompt cache.
+"""
+
+import pytest
+
+from app.mcp.prompts._cache import PromptCache
+
+
+class TestPromptCache:
+    """Test PromptCache hits, invalidation and isolation."""
+
+    @pytest.mark.unit
+    def test_hit_requires_matching_version(self):
+        """Test that an entry is only returned for the data version it was built from."""
+        cache = PromptCache(ttl=60)
+        cache.set("key", 1, {"name": "task_summary"})
+
+        assert cache.get("key", 1) == {"name": "task_summary"}
+        assert cache.get("key", 2) is None
+
+    @pytest.mark.unit
+    def test_mutating_results_does_not_change_cache(self):
+        """Test that callers mutating stored or returned payloads cannot poison the cache."""
+        cache = PromptCache(ttl=60)
+        payload = {"data": {"statuses": ["COMPLETED"]}}
+        cache.set("key", 1, payload)
+        payload["data"]["statuses"].append("stored")
+
+        first = cache.get("key", 1)
+        first["data"]["statuses"].append("returned")
+
+        assert cache.get("key", 1) == {"data": {"statuses": ["COMPLETED"]}}
@@ -0,0 +1,81 @@
+# ⏱️ Resource Cache Unit Tests
+"""
+Unit tests for the single-flight MCP resource cache.
+"""
+
+import asyncio
+
+import pytest
+
+from app.mcp.resources._cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    """Test AsyncTTLCache sharing and cancellation."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        """Test that concurrent misses wait for the single in-flight computation."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(cache.get_or_compute("key", factory) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert calls == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        """Test that a waiter recomputes when the task computing the value is cancelled."""
+        cache = AsyncTTLCache(ttl=60)
+        started = asyncio.Event()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.sleep(60)
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_compute("key", factory))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_compute("key", factory))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == "value"
+        assert calls == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_leader(self):
+        """Test that cancelling a waiting caller leaves the shared computation running."""
+        cache = AsyncTTLCache(ttl=60)
+        release = asyncio.Event()
+
+        async def factory():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_compute("key", factory))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute("key", factory))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+
+        assert await leader == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
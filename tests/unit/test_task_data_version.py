@@ -0,0 +1,80 @@
+# 🔢 Task Data Version Unit Tests
+"""
+Unit tests for the task data version used to invalidate prompt caches.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.crud import task_async as task_crud
+from app.database import Base
+from app.schemas import TaskCreate, TaskStatus, TaskUpdate
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Yield a session on a fresh in-memory SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _create(db, prompt):
+    task = await task_crud.create_task(db, obj_in=TaskCreate(prompt=prompt))
+    await db.commit()
+    return task
+
+
+class TestTaskDataVersion:
+    """Test that every kind of task write changes the data version."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_create_changes_version(self, db):
+        """Test that creating a task changes the version."""
+        before = await task_crud.get_task_data_version(db)
+        await _create(db, "first")
+
+        assert await task_crud.get_task_data_version(db) != before
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_deleting_older_task_changes_version(self, db):
+        """Test that deleting a task other than the newest changes the version."""
+        older = await _create(db, "older")
+        await _create(db, "newer")
+        before = await task_crud.get_task_data_version(db)
+
+        assert await task_crud.delete_task(db, task_id=older.id)
+        await db.commit()
+
+        assert await task_crud.get_task_data_version(db) != before
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_same_second_updates_change_version(self, db):
+        """Test that back-to-back updates change the version although updated_at has second resolution."""
+        task = await _create(db, "task")
+        versions = [await task_crud.get_task_data_version(db)]
+
+        for status in (TaskStatus.PROCESSING, TaskStatus.COMPLETED):
+            task = await task_crud.update_task(db, db_obj=task, obj_in=TaskUpdate(status=status))
+            await db.commit()
+            versions.append(await task_crud.get_task_data_version(db))
+
+        assert len(set(versions)) == len(versions)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_missing_delete_keeps_version(self, db):
+        """Test that deleting a task that does not exist leaves the version alone."""
+        await _create(db, "task")
+        before = await task_crud.get_task_data_version(db)
+
+        assert not await task_crud.delete_task(db, task_id=999)
+        assert await task_crud.get_task_data_version(db) == before